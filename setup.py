@@ -41,6 +41,7 @@ setup(
         "click>=8.1.0",
         "rich>=13.0.0",
         "pandas>=2.0.0",
+        "numpy>=1.24.0",
         "jinja2>=3.1.0",
         "matplotlib>=3.7.0",
         "python-dateutil>=2.8.0",
@@ -54,6 +55,9 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.5.0",
         ],
+        "fast": [
+            "orjson>=3.9",
+        ],
         "docs": [
             "sphinx>=7.0.0",
             "sphinx-rtd-theme>=1.3.0",
@@ -4,32 +4,58 @@ Abstract base class for resource analyzers
 """
 
 from abc import ABC, abstractmethod
+import functools
 import logging
-from datetime import datetime
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from utils.cost_calculator import CostCalculator
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of MetricDataQueries accepted by a single get_metric_data call
+METRIC_DATA_MAX_QUERIES = 500
+
+# Maximum number of values accepted by a single describe call filter
+FILTER_MAX_VALUES = 200
+
 
 class BaseAnalyzer(ABC):
     """Abstract base class for AWS resource analyzers"""
     
-    def __init__(self, client, config):
+    def __init__(self, client, config, tag_lookup=None, api_cache=None):
         """
         Initialize Base Analyzer
         
         Args:
             client: AWS service client
             config (dict): Application configuration
+            tag_lookup (TagLookup): Tag index used to narrow describe calls (optional)
+            api_cache (APICache): Disk cache for API responses (optional)
         """
         self.client = client
         self.config = config
+        self.tag_lookup = tag_lookup
+        self.api_cache = api_cache
         self.cost_calculator = CostCalculator(config)
+        
+        # Memoized pricing lookups: costs depend only on hashable arguments such as
+        # (volume_type, size, region), so repeated types are priced once per analyzer
+        self._ebs_cost = functools.lru_cache(maxsize=None)(self.cost_calculator.calculate_ebs_cost)
+        self._snapshot_cost = functools.lru_cache(maxsize=None)(self.cost_calculator.calculate_snapshot_cost)
+        self._eip_cost = functools.lru_cache(maxsize=None)(self.cost_calculator.calculate_eip_cost)
+        self._rds_cost = functools.lru_cache(maxsize=None)(self.cost_calculator.calculate_rds_cost)
         self.results = {
             'resources': [],
             'total_savings': 0.0,
             'analysis_date': datetime.now().isoformat()
         }
+        # Guards the findings when they are added from worker threads
+        self._results_lock = threading.Lock()
+        
+        # Last exclude_tags mapping seen by filter_by_tags and its (key, value) pairs
+        self._exclude_pairs = (None, frozenset())
     
     @abstractmethod
     def analyze(self):
@@ -45,6 +71,8 @@ class BaseAnalyzer(ABC):
         """
         Convert AWS tags to dictionary format
         
+        Tag keys repeat across resources, so they are interned and shared.
+        
         Args:
             tags (list): List of AWS tag dictionaries
             
@@ -54,7 +82,7 @@ class BaseAnalyzer(ABC):
         if not tags:
             return {}
         
-        return {tag['Key']: tag['Value'] for tag in tags}
+        return {sys.intern(tag['Key']): tag['Value'] for tag in tags}
     
     def filter_by_tags(self, resource, exclude_tags=None):
         """
@@ -62,32 +90,254 @@ class BaseAnalyzer(ABC):
         
         Args:
             resource (dict): Resource with 'tags' key
-            exclude_tags (dict): Tags that indicate exclusion
-            
+            exclude_tags (dict): Tags that indicate exclusion; a list value
+                excludes each of its values
+                
         Returns:
             bool: True if resource should be included
         """
         if not exclude_tags:
             return True
         
+        exclude_pairs = self._get_exclude_pairs(exclude_tags)
         resource_tags = resource.get('tags', {})
         
+        if exclude_pairs.isdisjoint(resource_tags.items()):
+            return True
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Excluding resource with tags %s", dict(exclude_pairs.intersection(resource_tags.items())))
+        return False
+    
+    def _get_exclude_pairs(self, exclude_tags):
+        """
+        Get exclusion tags as a set of (key, value) pairs
+        
+        The set is built on first use and reused while the same mapping is
+        passed in. Unhashable values other than lists can never equal a tag
+        value, so they are skipped.
+        
+        Args:
+            exclude_tags (dict): Tags that indicate exclusion
+            
+        Returns:
+            frozenset: (key, value) pairs that exclude a resource
+        """
+        cached_tags, exclude_pairs = self._exclude_pairs
+        if cached_tags is exclude_tags:
+            return exclude_pairs
+        
+        pairs = set()
         for key, value in exclude_tags.items():
-            if resource_tags.get(key) == value:
-                logger.debug(f"Excluding resource with tag {key}={value}")
-                return False
+            for item in value if isinstance(value, (list, tuple, set)) else (value,):
+                try:
+                    pairs.add((key, item))
+                except TypeError:
+                    logger.debug("Ignoring unhashable exclude_tags value for %s", key)
+        
+        exclude_pairs = frozenset(pairs)
+        self._exclude_pairs = (exclude_tags, exclude_pairs)
+        return exclude_pairs
+    
+    def get_id_filters(self, resource_type, filter_name, max_values=FILTER_MAX_VALUES):
+        """
+        Build describe call filters that limit results to tag index candidates
+        
+        Args:
+            resource_type (str): Tag index resource type (e.g., 'ec2:volume')
+            filter_name (str): Describe filter matching the resource ID (e.g., 'volume-id')
+            max_values (int): Maximum number of IDs per filter
+            
+        Returns:
+            list: One filter list per describe call. A single empty list when no
+                tag index is configured, and no entries when nothing matched.
+        """
+        if self.tag_lookup is None:
+            return [[]]
+        
+        resource_ids = sorted(self.tag_lookup.get_resource_ids(resource_type))
+        return [
+            [{'Name': filter_name, 'Values': resource_ids[i:i + max_values]}]
+            for i in range(0, len(resource_ids), max_values)
+        ]
+    
+    def cached_fetch(self, api_name, fetch, params=None):
+        """
+        Yield resources from a describe call, served from the API cache while fresh
         
-        return True
+        The cache key includes the tag index settings, since they change which
+        resources the describe calls return.
+        
+        Args:
+            api_name (str): API name used in the cache key (e.g., 'describe_volumes')
+            fetch (callable): Generator function performing the API calls
+            params: Other request parameters that change the response (optional)
+            
+        Yields:
+            dict: Resource details
+        """
+        if self.api_cache is None:
+            yield from fetch()
+            return
+        
+        key = (self.client.meta.region_name, api_name, self.config.get('tag_index', {}), params)
+        cached = self.api_cache.get(key)
+        if cached is not None:
+            logger.info(f"Using cached {api_name} response ({len(cached)} resources)")
+            yield from cached
+            return
+        
+        resources = []
+        for resource in fetch():
+            resources.append(resource)
+            yield resource
+        self.api_cache.set(key, resources)
     
     def add_finding(self, resource_data):
         """
-        Add a finding to results
+        Add a finding to results (safe to call from worker threads)
         
         Args:
             resource_data (dict): Resource information including cost
         """
-        self.results['resources'].append(resource_data)
-        self.results['total_savings'] += resource_data.get('monthly_cost', 0.0)
+        with self._results_lock:
+            self.results['resources'].append(resource_data)
+            self.results['total_savings'] += resource_data.get('monthly_cost', 0.0)
+    
+    def _batch_get_metrics(self, namespace, metric_name, dimension_name, resource_ids,
+                           period, analysis_period_days):
+        """
+        Get average CloudWatch metric values for many resources at once
+        
+        Args:
+            namespace (str): CloudWatch namespace (e.g., 'AWS/EC2')
+            metric_name (str): Metric name (e.g., 'CPUUtilization')
+            dimension_name (str): Dimension identifying the resource
+            resource_ids (list): Resource identifiers to fetch metrics for
+            period (int): Metric period in seconds
+            analysis_period_days (int): Number of days to look back
+            
+        Returns:
+            dict: Average metric value keyed by resource ID; resources
+                without datapoints are omitted
+        """
+        return self._batch_get_metric_set(
+            namespace, [metric_name], dimension_name, resource_ids, period, analysis_period_days
+        )[metric_name]
+    
+    def _batch_get_metric_set(self, namespace, metric_names, dimension_name, resource_ids,
+                              period, analysis_period_days):
+        """
+        Get average values of several CloudWatch metrics for many resources at once
+        
+        Every metric of a resource is requested in the same get_metric_data
+        call. Resources are grouped into calls of up to 500 queries, and the
+        groups are fetched concurrently. Requires the analyzer to set
+        self.cloudwatch and self.max_workers.
+        
+        Args:
+            namespace (str): CloudWatch namespace (e.g., 'AWS/RDS')
+            metric_names (list): Metric names (e.g., ['CPUUtilization', 'DatabaseConnections'])
+            dimension_name (str): Dimension identifying the resource
+            resource_ids (list): Resource identifiers to fetch metrics for
+            period (int): Metric period in seconds
+            analysis_period_days (int): Number of days to look back
+            
+        Returns:
+            dict: Per metric name, the average value keyed by resource ID;
+                resources without datapoints are omitted
+        """
+        resource_ids = list(resource_ids)
+        if not resource_ids:
+            return {metric_name: {} for metric_name in metric_names}
+        
+        cache_key = None
+        if self.api_cache is not None:
+            cache_key = (
+                self.cloudwatch.meta.region_name,
+                'get_metric_data',
+                namespace,
+                metric_names,
+                sorted(resource_ids),
+                period,
+                analysis_period_days
+            )
+            cached = self.api_cache.get(cache_key, self.api_cache.metrics_ttl_seconds)
+            if cached is not None:
+                return cached
+        
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(days=analysis_period_days)
+        
+        batch_size = METRIC_DATA_MAX_QUERIES // len(metric_names)
+        batches = [
+            resource_ids[i:i + batch_size]
+            for i in range(0, len(resource_ids), batch_size)
+        ]
+        
+        def fetch_batch(batch):
+            # Returns (averages keyed by (metric, resource ID), whether the calls succeeded)
+            # Query IDs encode the metric and resource positions: m<metric>_<resource>
+            queries = [
+                {
+                    'Id': f'm{metric_index}_{index}',
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': namespace,
+                            'MetricName': metric_name,
+                            'Dimensions': [{'Name': dimension_name, 'Value': resource_id}]
+                        },
+                        'Period': period,
+                        'Stat': 'Average'
+                    }
+                }
+                for metric_index, metric_name in enumerate(metric_names)
+                for index, resource_id in enumerate(batch)
+            ]
+            values = {query['Id']: [] for query in queries}
+            
+            try:
+                request = {
+                    'MetricDataQueries': queries,
+                    'StartTime': start_time,
+                    'EndTime': end_time
+                }
+                while True:
+                    response = self.cloudwatch.get_metric_data(**request)
+                    for result in response.get('MetricDataResults', []):
+                        values[result['Id']].extend(result.get('Values', []))
+                    
+                    next_token = response.get('NextToken')
+                    if not next_token:
+                        break
+                    request['NextToken'] = next_token
+                    
+            except Exception as e:
+                logger.error(f"Error getting {', '.join(metric_names)} metrics for {len(batch)} resources: {str(e)}")
+                return {}, False
+            
+            batch_averages = {}
+            for query_id, datapoints in values.items():
+                if datapoints:
+                    metric_index, index = query_id[1:].split('_')
+                    batch_averages[(metric_names[int(metric_index)], batch[int(index)])] = (
+                        sum(datapoints) / len(datapoints)
+                    )
+            return batch_averages, True
+        
+        averages = {metric_name: {} for metric_name in metric_names}
+        complete = True
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+            for batch_averages, succeeded in executor.map(fetch_batch, batches):
+                complete = complete and succeeded
+                for (metric_name, resource_id), average in batch_averages.items():
+                    averages[metric_name][resource_id] = average
+        
+        # Partial results are not cached, so a rerun fetches the failed batches again
+        if cache_key is not None and complete:
+            self.api_cache.set(cache_key, averages)
+        
+        return averages
     
     def get_results(self):
         """
@@ -97,5 +347,5 @@ class BaseAnalyzer(ABC):
             dict: Analysis results
         """
         logger.info(f"Analysis complete: {len(self.results['resources'])} resources found, "
-                   f"${self.results['total_savings']:.2f} potential monthly savings")
+                    f"${self.results['total_savings']:.2f} potential monthly savings")
         return self.results
@@ -4,7 +4,8 @@ Analyzes EBS volumes to identify unattached resources
 """
 
 import logging
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime, timezone
 from analyzers.base_analyzer import BaseAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -13,20 +14,25 @@ logger = logging.getLogger(__name__)
 class EBSAnalyzer(BaseAnalyzer):
     """Analyzes EBS volumes for unattached resources"""
     
-    def __init__(self, ec2_client, config):
+    def __init__(self, ec2_client, config, tag_lookup=None, api_cache=None):
         """
         Initialize EBS Analyzer
         
         Args:
             ec2_client: Boto3 EC2 client
             config (dict): Application configuration
+            tag_lookup (TagLookup): Tag index used to narrow describe calls (optional)
+            api_cache (APICache): Disk cache for API responses (optional)
         """
-        super().__init__(ec2_client, config)
+        super().__init__(ec2_client, config, tag_lookup, api_cache)
         
         # Get configuration parameters
         ebs_config = config.get('ebs', {})
         self.unattached_days_threshold = ebs_config.get('unattached_days_threshold', 7)
         self.include_delete_on_termination = ebs_config.get('include_delete_on_termination', False)
+        
+        # Reference time for volume ages, taken once per analyze() run
+        self._now = datetime.now(timezone.utc)
     
     def analyze(self):
         """
@@ -37,15 +43,18 @@ class EBSAnalyzer(BaseAnalyzer):
         """
         logger.info("Starting EBS volume analysis")
         
+        self._now = datetime.now(timezone.utc)
+        
         try:
-            # Get all volumes
-            volumes = self._get_all_volumes()
-            logger.info(f"Found {len(volumes)} EBS volumes")
+            # Analyze each volume as pages arrive
+            volume_count = 0
+            for volume in self.cached_fetch('describe_volumes', self._get_all_volumes):
+                volume_count += 1
+                is_unattached, days_unattached = self._is_volume_unattached(volume)
+                if is_unattached:
+                    self._add_unattached_volume(volume, days_unattached)
             
-            # Analyze each volume
-            for volume in volumes:
-                if self._is_volume_unattached(volume):
-                    self._add_unattached_volume(volume)
+            logger.info(f"Found {volume_count} available (unattached) EBS volumes")
             
             return self.get_results()
             
@@ -55,14 +64,23 @@ class EBSAnalyzer(BaseAnalyzer):
     
     def _get_all_volumes(self):
         """
-        Get all EBS volumes
+        Get all unattached EBS volumes, one page at a time
         
-        Returns:
-            list: List of EBS volumes
+        Only volumes in the 'available' state are requested, so in-use
+        volumes are filtered out by AWS instead of being downloaded.
+        
+        Yields:
+            dict: EBS volume details
         """
         try:
-            response = self.client.describe_volumes()
-            return response['Volumes']
+            paginator = self.client.get_paginator('describe_volumes')
+            
+            for id_filters in self.get_id_filters('ec2:volume', 'volume-id'):
+                for page in paginator.paginate(
+                    Filters=[{'Name': 'status', 'Values': ['available']}] + id_filters,
+                    PaginationConfig={'PageSize': 500}
+                ):
+                    yield from page['Volumes']
             
         except Exception as e:
             logger.error(f"Error fetching EBS volumes: {str(e)}")
@@ -70,49 +88,50 @@ class EBSAnalyzer(BaseAnalyzer):
     
     def _is_volume_unattached(self, volume):
         """
-        Check if a volume is unattached
+        Check if an unattached volume meets the reporting criteria
+        
+        Volumes are pre-filtered to the 'available' state by
+        _get_all_volumes, so only age and tags are checked here.
         
         Args:
             volume (dict): EBS volume details
             
         Returns:
-            bool: True if volume is unattached and meets criteria
+            tuple: (bool, int) - True if volume is unattached and meets
+                criteria, and the number of days it has been unattached
         """
-        # Check if volume has any attachments
-        if volume['Attachments']:
-            return False
-        
         # Check how long the volume has been unattached
-        create_time = volume['CreateTime']
-        days_unattached = (datetime.now(create_time.tzinfo) - create_time).days
+        days_unattached = (self._now - volume['CreateTime']).days
         
         if days_unattached < self.unattached_days_threshold:
-            logger.debug(f"Volume {volume['VolumeId']} unattached for {days_unattached} days (below threshold)")
-            return False
+            logger.debug("Volume %s unattached for %d days (below threshold)", volume['VolumeId'], days_unattached)
+            return False, days_unattached
         
-        # Check DeleteOnTermination tag if configured
+        # Check DeleteOnTermination tag if configured (scan the tag list directly,
+        # the full tag dict is only built for volumes that are reported)
         if not self.include_delete_on_termination:
-            tags = self.get_resource_tags(volume.get('Tags', []))
-            if tags.get('DeleteOnTermination', '').lower() == 'true':
-                logger.debug(f"Volume {volume['VolumeId']} has DeleteOnTermination=true")
-                return False
+            for tag in volume.get('Tags') or ():
+                if tag['Key'] == 'DeleteOnTermination' and tag['Value'].lower() == 'true':
+                    logger.debug("Volume %s has DeleteOnTermination=true", volume['VolumeId'])
+                    return False, days_unattached
         
-        return True
+        return True, days_unattached
     
-    def _add_unattached_volume(self, volume):
+    def _add_unattached_volume(self, volume, days_unattached):
         """
         Add unattached volume to findings
         
         Args:
             volume (dict): EBS volume details
+            days_unattached (int): Days since the volume was created
         """
         volume_id = volume['VolumeId']
-        volume_type = volume['VolumeType']
+        volume_type = sys.intern(volume['VolumeType'])
         volume_size = volume['Size']
-        region = self.client.meta.region_name
+        region = sys.intern(self.client.meta.region_name)
         
         # Calculate cost
-        monthly_cost = self.cost_calculator.calculate_ebs_cost(
+        monthly_cost = self._ebs_cost(
             volume_type,
             volume_size,
             region
@@ -122,9 +141,7 @@ class EBSAnalyzer(BaseAnalyzer):
         tags = self.get_resource_tags(volume.get('Tags', []))
         volume_name = tags.get('Name', 'N/A')
         
-        # Calculate days unattached
         create_time = volume['CreateTime']
-        days_unattached = (datetime.now(create_time.tzinfo) - create_time).days
         
         resource_data = {
             'volume_id': volume_id,
@@ -3,8 +3,11 @@ EC2 Analyzer
 Analyzes EC2 instances to identify idle resources
 """
 
+import itertools
 import logging
-from datetime import datetime, timedelta
+import sys
+import numpy as np
+from datetime import datetime, timezone
 from analyzers.base_analyzer import BaseAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -13,7 +16,7 @@ logger = logging.getLogger(__name__)
 class EC2Analyzer(BaseAnalyzer):
     """Analyzes EC2 instances for idle resources"""
     
-    def __init__(self, ec2_client, cloudwatch_client, config):
+    def __init__(self, ec2_client, cloudwatch_client, config, tag_lookup=None, api_cache=None):
         """
         Initialize EC2 Analyzer
         
@@ -21,8 +24,10 @@ class EC2Analyzer(BaseAnalyzer):
             ec2_client: Boto3 EC2 client
             cloudwatch_client: Boto3 CloudWatch client
             config (dict): Application configuration
+            tag_lookup (TagLookup): Tag index used to narrow describe calls (optional)
+            api_cache (APICache): Disk cache for API responses (optional)
         """
-        super().__init__(ec2_client, config)
+        super().__init__(ec2_client, config, tag_lookup, api_cache)
         self.cloudwatch = cloudwatch_client
         
         # Get configuration parameters
@@ -31,6 +36,10 @@ class EC2Analyzer(BaseAnalyzer):
         self.analysis_period_days = ec2_config.get('analysis_period_days', 7)
         self.metric_period_minutes = ec2_config.get('metric_period_minutes', 60)
         self.minimum_uptime_hours = ec2_config.get('minimum_uptime_hours', 24)
+        self.max_workers = ec2_config.get('max_workers', 20)
+        
+        # Reference time for uptime checks, taken once per analyze() run
+        self._now = datetime.now(timezone.utc)
     
     def analyze(self):
         """
@@ -40,16 +49,34 @@ class EC2Analyzer(BaseAnalyzer):
             dict: Analysis results with idle instances
         """
         logger.info("Starting EC2 instance analysis")
+        self._now = datetime.now(timezone.utc)
         
         try:
-            # Get all running instances
-            instances = self._get_running_instances()
+            # Get all running instances; metrics are batched across all of them,
+            # so the streamed instances are collected before the idle checks
+            instances = list(self.cached_fetch('describe_instances', self._get_running_instances))
             logger.info(f"Found {len(instances)} running EC2 instances")
             
-            # Analyze each instance
-            for instance in instances:
-                if self._is_instance_idle(instance):
-                    self._add_idle_instance(instance)
+            # Only instances up long enough need metrics; their CPU is fetched
+            # in batched requests
+            candidates = [instance for instance in instances if self._is_candidate(instance)]
+            cpu_averages = self._batch_get_metrics(
+                'AWS/EC2',
+                'CPUUtilization',
+                'InstanceId',
+                [instance['InstanceId'] for instance in candidates],
+                self.metric_period_minutes * 60,
+                self.analysis_period_days
+            )
+            
+            # Classify all candidates at once, then price and record the idle ones
+            idle_instances = [candidates[index] for index in np.flatnonzero(self._idle_mask(candidates, cpu_averages))]
+            monthly_costs = self.cost_calculator.calculate_ec2_cost_bulk(
+                [instance['InstanceType'] for instance in idle_instances],
+                [self.client.meta.region_name] * len(idle_instances)
+            )
+            for instance, monthly_cost in zip(idle_instances, monthly_costs):
+                self._add_idle_instance(instance, cpu_averages.get(instance['InstanceId']), float(monthly_cost))
             
             return self.get_results()
             
@@ -59,117 +86,86 @@ class EC2Analyzer(BaseAnalyzer):
     
     def _get_running_instances(self):
         """
-        Get all running EC2 instances
+        Get all running EC2 instances, one page at a time
         
-        Returns:
-            list: List of running EC2 instances
+        Yields:
+            dict: Running EC2 instance details
         """
         try:
-            response = self.client.describe_instances(
-                Filters=[
-                    {'Name': 'instance-state-name', 'Values': ['running']}
-                ]
+            paginator = self.client.get_paginator('describe_instances')
+            pages = (
+                page
+                for id_filters in self.get_id_filters('ec2:instance', 'instance-id')
+                for page in paginator.paginate(
+                    Filters=[
+                        {'Name': 'instance-state-name', 'Values': ['running']}
+                    ] + id_filters,
+                    PaginationConfig={'PageSize': 100}
+                )
             )
             
-            instances = []
-            for reservation in response['Reservations']:
-                instances.extend(reservation['Instances'])
-            
-            return instances
+            yield from itertools.chain.from_iterable(
+                reservation['Instances']
+                for page in pages
+                for reservation in page['Reservations']
+            )
             
         except Exception as e:
             logger.error(f"Error fetching EC2 instances: {str(e)}")
             raise
     
-    def _is_instance_idle(self, instance):
+    def _is_candidate(self, instance):
         """
-        Check if an instance is idle based on CPU utilization
+        Check the predicate that needs no metrics: uptime
         
         Args:
             instance (dict): EC2 instance details
             
         Returns:
-            bool: True if instance is idle
+            bool: True if the instance could be idle
         """
-        instance_id = instance['InstanceId']
-        
-        # Check if instance has been running long enough
-        launch_time = instance['LaunchTime']
-        uptime_hours = (datetime.now(launch_time.tzinfo) - launch_time).total_seconds() / 3600
-        
+        uptime_hours = (self._now - instance['LaunchTime']).total_seconds() / 3600
         if uptime_hours < self.minimum_uptime_hours:
-            logger.debug(f"Instance {instance_id} uptime ({uptime_hours:.1f}h) below minimum")
+            logger.debug("Instance %s has been running for only %.1f hours", instance['InstanceId'], uptime_hours)
             return False
         
-        # Get CPU utilization metrics
-        avg_cpu = self._get_average_cpu_utilization(instance_id)
-        
-        if avg_cpu is None:
-            logger.warning(f"Could not get CPU metrics for {instance_id}")
-            return False
-        
-        logger.debug(f"Instance {instance_id} average CPU: {avg_cpu:.2f}%")
-        
-        return avg_cpu < self.cpu_threshold
+        return True
     
-    def _get_average_cpu_utilization(self, instance_id):
+    def _idle_mask(self, instances, cpu_averages):
         """
-        Get average CPU utilization for an instance
+        Check which instances are idle based on CPU utilization
         
         Args:
-            instance_id (str): EC2 instance ID
+            instances (list): EC2 instance details (candidates only)
+            cpu_averages (dict): Average CPU keyed by instance ID
             
         Returns:
-            float: Average CPU utilization percentage
+            numpy.ndarray: Boolean mask, True where the instance is idle
         """
-        try:
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(days=self.analysis_period_days)
-            
-            response = self.cloudwatch.get_metric_statistics(
-                Namespace='AWS/EC2',
-                MetricName='CPUUtilization',
-                Dimensions=[
-                    {'Name': 'InstanceId', 'Value': instance_id}
-                ],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=self.metric_period_minutes * 60,
-                Statistics=['Average']
-            )
-            
-            if not response['Datapoints']:
-                return None
-            
-            # Calculate average across all datapoints
-            datapoints = response['Datapoints']
-            avg_cpu = sum(dp['Average'] for dp in datapoints) / len(datapoints)
-            
-            return avg_cpu
-            
-        except Exception as e:
-            logger.error(f"Error getting CloudWatch metrics for {instance_id}: {str(e)}")
-            return None
+        # Instances without CPU datapoints become NaN, which never counts as idle
+        avg_cpu = np.array(
+            [cpu_averages.get(instance['InstanceId']) for instance in instances],
+            dtype=float
+        )
+        
+        missing_cpu = np.isnan(avg_cpu)
+        if missing_cpu.any():
+            logger.warning(f"Could not get CPU metrics for {int(missing_cpu.sum())} instances")
+        
+        return avg_cpu < self.cpu_threshold
     
-    def _add_idle_instance(self, instance):
+    def _add_idle_instance(self, instance, avg_cpu, monthly_cost):
         """
         Add idle instance to findings
         
         Args:
             instance (dict): EC2 instance details
+            avg_cpu (float): Average CPU utilization percentage
+            monthly_cost (float): Monthly cost in USD
         """
         instance_id = instance['InstanceId']
-        instance_type = instance['InstanceType']
-        region = self.client.meta.region_name
-        
-        # Get average CPU utilization
-        avg_cpu = self._get_average_cpu_utilization(instance_id)
-        
-        # Calculate cost
-        monthly_cost = self.cost_calculator.calculate_ec2_cost(
-            instance_type,
-            region
-        )
+        instance_type = sys.intern(instance['InstanceType'])
+        region = sys.intern(self.client.meta.region_name)
         
         # Get instance name from tags
         tags = self.get_resource_tags(instance.get('Tags', []))
@@ -181,7 +177,7 @@ class EC2Analyzer(BaseAnalyzer):
             'instance_type': instance_type,
             'region': region,
             'launch_time': instance['LaunchTime'].isoformat(),
-            'state': instance['State']['Name'],
+            'state': sys.intern(instance['State']['Name']),
             'average_cpu': avg_cpu if avg_cpu is not None else 0,
             'monthly_cost': monthly_cost,
             'tags': tags,
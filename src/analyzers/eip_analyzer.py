@@ -4,6 +4,7 @@ Analyzes Elastic IPs to identify unused/unattached addresses
 """
 
 import logging
+import sys
 from datetime import datetime
 from analyzers.base_analyzer import BaseAnalyzer
 
@@ -13,15 +14,17 @@ logger = logging.getLogger(__name__)
 class EIPAnalyzer(BaseAnalyzer):
     """Analyzes Elastic IPs for unused addresses"""
     
-    def __init__(self, ec2_client, config):
+    def __init__(self, ec2_client, config, tag_lookup=None, api_cache=None):
         """
         Initialize EIP Analyzer
         
         Args:
             ec2_client: Boto3 EC2 client
             config (dict): Application configuration
+            tag_lookup (TagLookup): Tag index used to narrow describe calls (optional)
+            api_cache (APICache): Disk cache for API responses (optional)
         """
-        super().__init__(ec2_client, config)
+        super().__init__(ec2_client, config, tag_lookup, api_cache)
     
     def analyze(self):
         """
@@ -34,7 +37,7 @@ class EIPAnalyzer(BaseAnalyzer):
         
         try:
             # Get all Elastic IPs
-            addresses = self._get_all_addresses()
+            addresses = list(self.cached_fetch('describe_addresses', self._get_all_addresses))
             logger.info(f"Found {len(addresses)} Elastic IPs")
             
             # Analyze each address
@@ -56,8 +59,12 @@ class EIPAnalyzer(BaseAnalyzer):
             list: List of Elastic IP addresses
         """
         try:
-            response = self.client.describe_addresses()
-            return response.get('Addresses', [])
+            addresses = []
+            for id_filters in self.get_id_filters('ec2:elastic-ip', 'allocation-id'):
+                response = self.client.describe_addresses(Filters=id_filters)
+                addresses.extend(response.get('Addresses', []))
+            
+            return addresses
             
         except Exception as e:
             logger.error(f"Error fetching Elastic IPs: {str(e)}")
@@ -93,11 +100,11 @@ class EIPAnalyzer(BaseAnalyzer):
         """
         public_ip = address.get('PublicIp', 'N/A')
         allocation_id = address.get('AllocationId', 'N/A')
-        region = self.client.meta.region_name
-        domain = address.get('Domain', 'vpc')
+        region = sys.intern(self.client.meta.region_name)
+        domain = sys.intern(address.get('Domain', 'vpc'))
         
         # Calculate cost - unused EIPs are charged ~$0.005/hour = ~$3.60/month
-        monthly_cost = self.cost_calculator.calculate_eip_cost(region)
+        monthly_cost = self._eip_cost(region)
         
         # Get tags
         tags = self.get_resource_tags(address.get('Tags', []))
@@ -4,7 +4,9 @@ Analyzes RDS instances to identify idle/underutilized databases
 """
 
 import logging
-from datetime import datetime, timedelta
+import sys
+import numpy as np
+from datetime import datetime, timezone
 from analyzers.base_analyzer import BaseAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -13,7 +15,7 @@ logger = logging.getLogger(__name__)
 class RDSAnalyzer(BaseAnalyzer):
     """Analyzes RDS instances for idle/underutilized databases"""
     
-    def __init__(self, rds_client, cloudwatch_client, config):
+    def __init__(self, rds_client, cloudwatch_client, config, tag_lookup=None, api_cache=None):
         """
         Initialize RDS Analyzer
         
@@ -21,8 +23,10 @@ class RDSAnalyzer(BaseAnalyzer):
             rds_client: Boto3 RDS client
             cloudwatch_client: Boto3 CloudWatch client
             config (dict): Application configuration
+            tag_lookup (TagLookup): Tag index used to narrow describe calls (optional)
+            api_cache (APICache): Disk cache for API responses (optional)
         """
-        super().__init__(rds_client, config)
+        super().__init__(rds_client, config, tag_lookup, api_cache)
         self.cloudwatch = cloudwatch_client
         
         # Get configuration parameters
@@ -31,6 +35,11 @@ class RDSAnalyzer(BaseAnalyzer):
         self.connections_threshold = rds_config.get('connections_threshold', 1)
         self.analysis_period_days = rds_config.get('analysis_period_days', 7)
         self.minimum_uptime_hours = rds_config.get('minimum_uptime_hours', 24)
+        self.max_workers = rds_config.get('max_workers', 20)
+        self.skip_read_replicas = rds_config.get('skip_read_replicas', True)
+        
+        # Reference time for uptime checks, taken once per analyze() run
+        self._now = datetime.now(timezone.utc)
     
     def analyze(self):
         """
@@ -40,16 +49,37 @@ class RDSAnalyzer(BaseAnalyzer):
             dict: Analysis results with idle RDS instances
         """
         logger.info("Starting RDS instance analysis")
+        self._now = datetime.now(timezone.utc)
         
         try:
             # Get all RDS instances
-            instances = self._get_all_instances()
+            instances = list(self.cached_fetch('describe_db_instances', self._get_all_instances))
             logger.info(f"Found {len(instances)} RDS instances")
             
-            # Analyze each instance
-            for instance in instances:
-                if self._is_instance_idle(instance):
-                    self._add_idle_instance(instance)
+            # Only instances passing the cheap checks need metrics; CPU and
+            # connections are fetched together in batched requests
+            candidates = [instance for instance in instances if self._is_candidate(instance)]
+            metrics = self._batch_get_metric_set(
+                'AWS/RDS',
+                ['CPUUtilization', 'DatabaseConnections'],
+                'DBInstanceIdentifier',
+                [instance['DBInstanceIdentifier'] for instance in candidates],
+                3600,
+                self.analysis_period_days
+            )
+            cpu_averages = metrics['CPUUtilization']
+            connection_averages = metrics['DatabaseConnections']
+            
+            # Classify all candidates at once, then record the idle ones
+            idle_mask = self._idle_mask(candidates, cpu_averages, connection_averages)
+            for index in np.flatnonzero(idle_mask):
+                instance = candidates[index]
+                db_instance_id = instance['DBInstanceIdentifier']
+                self._add_idle_instance(
+                    instance,
+                    cpu_averages.get(db_instance_id),
+                    connection_averages.get(db_instance_id)
+                )
             
             return self.get_results()
             
@@ -68,8 +98,13 @@ class RDSAnalyzer(BaseAnalyzer):
             instances = []
             paginator = self.client.get_paginator('describe_db_instances')
             
-            for page in paginator.paginate():
-                instances.extend(page.get('DBInstances', []))
+            # RDS accepts at most 100 values per filter
+            for id_filters in self.get_id_filters('rds:db', 'db-instance-id', max_values=100):
+                for page in paginator.paginate(
+                    Filters=id_filters,
+                    PaginationConfig={'PageSize': 100}
+                ):
+                    instances.extend(page.get('DBInstances', []))
             
             return instances
             
@@ -77,151 +112,89 @@ class RDSAnalyzer(BaseAnalyzer):
             logger.error(f"Error fetching RDS instances: {str(e)}")
             raise
     
-    def _is_instance_idle(self, instance):
+    def _is_candidate(self, instance):
         """
-        Check if an RDS instance is idle based on CPU and connections
+        Check the predicates that need no metrics: status, role and uptime
         
         Args:
             instance (dict): RDS instance details
             
         Returns:
-            bool: True if instance is idle
+            bool: True if the instance could be idle
         """
         db_instance_id = instance['DBInstanceIdentifier']
         instance_status = instance.get('DBInstanceStatus', '')
         
         # Only analyze running instances
         if instance_status != 'available':
-            logger.debug(f"RDS {db_instance_id} is not available (status: {instance_status})")
+            logger.debug("RDS %s is not available (status: %s)", db_instance_id, instance_status)
+            return False
+        
+        # Read replicas are sized by their source instance, not by their own load
+        if self.skip_read_replicas and instance.get('ReadReplicaSourceDBInstanceIdentifier'):
+            logger.debug("RDS %s is a read replica, skipping", db_instance_id)
             return False
         
         # Check minimum uptime
         launch_time = instance.get('InstanceCreateTime')
         if launch_time:
-            uptime_hours = (datetime.now(launch_time.tzinfo) - launch_time).total_seconds() / 3600
+            uptime_hours = (self._now - launch_time).total_seconds() / 3600
             if uptime_hours < self.minimum_uptime_hours:
-                logger.debug(f"RDS {db_instance_id} has been running for only {uptime_hours:.1f} hours")
+                logger.debug("RDS %s has been running for only %.1f hours", db_instance_id, uptime_hours)
                 return False
         
-        # Check CPU utilization
-        avg_cpu = self._get_average_cpu(db_instance_id)
-        if avg_cpu is None:
-            logger.debug(f"No CPU metrics available for RDS {db_instance_id}")
-            return False
-        
-        if avg_cpu >= self.cpu_threshold:
-            logger.debug(f"RDS {db_instance_id} CPU is {avg_cpu:.2f}% (above threshold)")
-            return False
-        
-        # Check database connections
-        avg_connections = self._get_average_connections(db_instance_id)
-        if avg_connections is not None and avg_connections > self.connections_threshold:
-            logger.debug(f"RDS {db_instance_id} has {avg_connections:.1f} avg connections")
-            return False
-        
-        logger.info(f"RDS {db_instance_id} appears idle: CPU={avg_cpu:.2f}%, Connections={avg_connections}")
         return True
     
-    def _get_average_cpu(self, db_instance_id):
+    def _idle_mask(self, instances, cpu_averages, connection_averages):
         """
-        Get average CPU utilization for an RDS instance
+        Check which RDS instances are idle based on CPU and connections
         
         Args:
-            db_instance_id (str): RDS instance identifier
+            instances (list): RDS instance details (candidates only)
+            cpu_averages (dict): Average CPU keyed by DB instance identifier
+            connection_averages (dict): Average connections keyed by DB instance identifier
             
         Returns:
-            float: Average CPU utilization percentage
+            numpy.ndarray: Boolean mask, True where the instance is idle
         """
-        try:
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(days=self.analysis_period_days)
-            
-            response = self.cloudwatch.get_metric_statistics(
-                Namespace='AWS/RDS',
-                MetricName='CPUUtilization',
-                Dimensions=[
-                    {
-                        'Name': 'DBInstanceIdentifier',
-                        'Value': db_instance_id
-                    }
-                ],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=3600,  # 1 hour
-                Statistics=['Average']
-            )
-            
-            datapoints = response.get('Datapoints', [])
-            if not datapoints:
-                return None
-            
-            return sum(dp['Average'] for dp in datapoints) / len(datapoints)
-            
-        except Exception as e:
-            logger.error(f"Error getting CPU metrics for RDS {db_instance_id}: {str(e)}")
-            return None
-    
-    def _get_average_connections(self, db_instance_id):
-        """
-        Get average database connections for an RDS instance
+        db_instance_ids = [instance['DBInstanceIdentifier'] for instance in instances]
         
-        Args:
-            db_instance_id (str): RDS instance identifier
-            
-        Returns:
-            float: Average number of database connections
-        """
-        try:
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(days=self.analysis_period_days)
-            
-            response = self.cloudwatch.get_metric_statistics(
-                Namespace='AWS/RDS',
-                MetricName='DatabaseConnections',
-                Dimensions=[
-                    {
-                        'Name': 'DBInstanceIdentifier',
-                        'Value': db_instance_id
-                    }
-                ],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=3600,  # 1 hour
-                Statistics=['Average']
-            )
-            
-            datapoints = response.get('Datapoints', [])
-            if not datapoints:
-                return None
-            
-            return sum(dp['Average'] for dp in datapoints) / len(datapoints)
-            
-        except Exception as e:
-            logger.error(f"Error getting connection metrics for RDS {db_instance_id}: {str(e)}")
-            return None
+        # Missing metrics become NaN: no CPU data never counts as idle, while
+        # no connection data does not rule an instance out
+        avg_cpu = np.array(
+            [cpu_averages.get(db_instance_id) for db_instance_id in db_instance_ids],
+            dtype=float
+        )
+        avg_connections = np.array(
+            [connection_averages.get(db_instance_id) for db_instance_id in db_instance_ids],
+            dtype=float
+        )
+        
+        return (avg_cpu < self.cpu_threshold) & ~(avg_connections > self.connections_threshold)
     
-    def _add_idle_instance(self, instance):
+    def _add_idle_instance(self, instance, avg_cpu, avg_connections):
         """
         Add idle RDS instance to findings
         
         Args:
             instance (dict): RDS instance details
+            avg_cpu (float): Average CPU utilization percentage (None if unknown)
+            avg_connections (float): Average database connections (None if unknown)
         """
         db_instance_id = instance['DBInstanceIdentifier']
-        instance_class = instance['DBInstanceClass']
-        engine = instance.get('Engine', 'N/A')
+        instance_class = sys.intern(instance['DBInstanceClass'])
+        engine = sys.intern(instance.get('Engine', 'N/A'))
         engine_version = instance.get('EngineVersion', 'N/A')
-        region = self.client.meta.region_name
+        region = sys.intern(self.client.meta.region_name)
         multi_az = instance.get('MultiAZ', False)
-        storage_type = instance.get('StorageType', 'gp2')
+        storage_type = sys.intern(instance.get('StorageType', 'gp2'))
         allocated_storage = instance.get('AllocatedStorage', 0)
         
-        # Get CPU and connections for reporting
-        avg_cpu = self._get_average_cpu(db_instance_id) or 0.0
-        avg_connections = self._get_average_connections(db_instance_id) or 0.0
+        avg_cpu = avg_cpu or 0.0
+        avg_connections = avg_connections or 0.0
         
         # Calculate cost
-        monthly_cost = self.cost_calculator.calculate_rds_cost(
+        monthly_cost = self._rds_cost(
             instance_class,
             engine,
             region,
@@ -243,12 +216,12 @@ class RDSAnalyzer(BaseAnalyzer):
             'db_instance_id': db_instance_id,
             'instance_name': instance_name,
             'instance_class': instance_class,
-            'engine': f"{engine} {engine_version}",
+            'engine': sys.intern(f"{engine} {engine_version}"),
             'region': region,
             'multi_az': multi_az,
             'storage_type': storage_type,
             'allocated_storage_gb': allocated_storage,
-            'status': instance.get('DBInstanceStatus', 'N/A'),
+            'status': sys.intern(instance.get('DBInstanceStatus', 'N/A')),
             'launch_time': launch_time_str,
             'avg_cpu_percent': round(avg_cpu, 2),
             'avg_connections': round(avg_connections, 2),
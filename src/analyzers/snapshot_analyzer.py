@@ -4,8 +4,9 @@ Analyzes EBS snapshots to identify outdated resources
 """
 
 import logging
-from datetime import datetime, timedelta
-from analyzers.base_analyzer import BaseAnalyzer
+import sys
+from datetime import datetime, timedelta, timezone
+from analyzers.base_analyzer import BaseAnalyzer, FILTER_MAX_VALUES
 
 logger = logging.getLogger(__name__)
 
@@ -13,20 +14,27 @@ logger = logging.getLogger(__name__)
 class SnapshotAnalyzer(BaseAnalyzer):
     """Analyzes EBS snapshots for outdated resources"""
     
-    def __init__(self, ec2_client, config):
+    def __init__(self, ec2_client, config, api_cache=None):
         """
         Initialize Snapshot Analyzer
         
         Args:
             ec2_client: Boto3 EC2 client
             config (dict): Application configuration
+            api_cache (APICache): Disk cache for API responses (optional)
         """
-        super().__init__(ec2_client, config)
+        super().__init__(ec2_client, config, api_cache=api_cache)
         
         # Get configuration parameters
         snapshot_config = config.get('snapshots', {})
         self.retention_days = snapshot_config.get('retention_days', 90)
         self.exclude_ami_snapshots = snapshot_config.get('exclude_ami_snapshots', True)
+        self.ami_cache_ttl_seconds = snapshot_config.get('ami_cache_ttl_seconds', 86400)
+        
+        # Reference time for age checks and the matching retention cutoff,
+        # taken once per analyze() run
+        self._now = datetime.now(timezone.utc)
+        self._cutoff = self._now - timedelta(days=self.retention_days)
     
     def analyze(self):
         """
@@ -36,22 +44,46 @@ class SnapshotAnalyzer(BaseAnalyzer):
             dict: Analysis results with outdated snapshots
         """
         logger.info("Starting EBS snapshot analysis")
+        self._now = datetime.now(timezone.utc)
+        self._cutoff = self._now - timedelta(days=self.retention_days)
         
         try:
-            # Get all snapshots owned by account
-            snapshots = self._get_account_snapshots()
-            logger.info(f"Found {len(snapshots)} EBS snapshots")
+            # Check each snapshot owned by the account as pages arrive
+            snapshot_count = 0
+            outdated_snapshots = []
+            # The listing is reused from the API cache on quick reruns; the
+            # start-time filter depends on the cutoff day, so it is part of the key
+            snapshots = self.cached_fetch(
+                'describe_snapshots',
+                self._get_account_snapshots,
+                params=self._cutoff.date().isoformat()
+            )
+            for snapshot in snapshots:
+                snapshot_count += 1
+                if self._is_snapshot_outdated(snapshot):
+                    outdated_snapshots.append(snapshot)
+            
+            logger.info("Found %d EBS snapshots", snapshot_count)
             
-            # Get AMI snapshots if we need to exclude them
-            ami_snapshot_ids = set()
+            # Nothing to clean up, so there is no need to list AMIs either
+            if not outdated_snapshots:
+                return self.get_results()
+            
+            # Exclude AMI snapshots if configured
             if self.exclude_ami_snapshots:
                 ami_snapshot_ids = self._get_ami_snapshot_ids()
-                logger.info(f"Found {len(ami_snapshot_ids)} snapshots associated with AMIs")
+                logger.info("Found %d snapshots associated with AMIs", len(ami_snapshot_ids))
+                outdated_snapshots = [
+                    snapshot for snapshot in outdated_snapshots
+                    if not self._is_ami_snapshot(snapshot, ami_snapshot_ids)
+                ]
             
-            # Analyze each snapshot
-            for snapshot in snapshots:
-                if self._is_snapshot_outdated(snapshot, ami_snapshot_ids):
-                    self._add_outdated_snapshot(snapshot)
+            # Look up the source volumes of all outdated snapshots in batches
+            volume_states = self._get_volume_states(
+                {snapshot.get('VolumeId') for snapshot in outdated_snapshots}
+            )
+            for snapshot in outdated_snapshots:
+                self._add_outdated_snapshot(snapshot, volume_states)
             
             return self.get_results()
             
@@ -61,34 +93,91 @@ class SnapshotAnalyzer(BaseAnalyzer):
     
     def _get_account_snapshots(self):
         """
-        Get all EBS snapshots owned by the account
+        Get EBS snapshots owned by the account, one page at a time
         
-        Returns:
-            list: List of EBS snapshots
+        Only snapshots started on or before the retention cutoff day are
+        requested; the exact age check is still done by _is_snapshot_outdated.
+        
+        Yields:
+            dict: EBS snapshot details
         """
         try:
-            response = self.client.describe_snapshots(OwnerIds=['self'])
-            return response['Snapshots']
+            request = {
+                'OwnerIds': ['self'],
+                'Filters': [
+                    {'Name': 'start-time', 'Values': self._start_time_patterns(self._cutoff)}
+                ],
+                'MaxResults': 1000
+            }
             
+            while True:
+                response = self.client.describe_snapshots(**request)
+                yield from response['Snapshots']
+                
+                next_token = response.get('NextToken')
+                if not next_token:
+                    break
+                request['NextToken'] = next_token
+                
         except Exception as e:
             logger.error(f"Error fetching EBS snapshots: {str(e)}")
             raise
     
+    @staticmethod
+    def _start_time_patterns(cutoff):
+        """
+        Build start-time filter patterns matching every day up to the cutoff
+        
+        EC2 filters do not support ranges, only '*' wildcards, so the range is
+        covered by whole decades, years, months and finally single days.
+        
+        Args:
+            cutoff (datetime): Latest start time of interest
+            
+        Returns:
+            list: Wildcard patterns (e.g., '201*', '2023-*', '2024-03-*', '2024-05-07*')
+        """
+        year, month, day = cutoff.year, cutoff.month, cutoff.day
+        
+        patterns = [f"{decade}*" for decade in range(200, year // 10)]
+        patterns += [f"{y}-*" for y in range(year // 10 * 10, year)]
+        patterns += [f"{year}-{m:02d}-*" for m in range(1, month)]
+        patterns += [f"{year}-{month:02d}-{d:02d}*" for d in range(1, day + 1)]
+        
+        return patterns
+    
     def _get_ami_snapshot_ids(self):
         """
         Get snapshot IDs associated with AMIs
         
+        AMIs change rarely, so the IDs are kept in the API cache (when
+        enabled) for ami_cache_ttl_seconds.
+        
         Returns:
             set: Set of snapshot IDs used by AMIs
         """
+        cache_key = (self.client.meta.region_name, 'ami_snapshot_ids')
+        if self.api_cache is not None:
+            cached = self.api_cache.get(cache_key, self.ami_cache_ttl_seconds)
+            if cached is not None:
+                return set(cached)
+        
         try:
-            response = self.client.describe_images(Owners=['self'])
-            snapshot_ids = set()
+            # Owners=['self'] keeps this to the account's own AMIs (listing public
+            # images is very slow); failed images do not hold on to snapshots
+            response = self.client.describe_images(
+                Owners=['self'],
+                Filters=[{'Name': 'state', 'Values': ['available', 'pending']}]
+            )
+            snapshot_ids = {
+                block_device['Ebs']['SnapshotId']
+                for image in response['Images']
+                for block_device in image.get('BlockDeviceMappings') or ()
+                if 'Ebs' in block_device and 'SnapshotId' in block_device['Ebs']
+            }
             
-            for image in response['Images']:
-                for block_device in image.get('BlockDeviceMappings', []):
-                    if 'Ebs' in block_device and 'SnapshotId' in block_device['Ebs']:
-                        snapshot_ids.add(block_device['Ebs']['SnapshotId'])
+            if self.api_cache is not None:
+                self.api_cache.set(cache_key, snapshot_ids)
             
             return snapshot_ids
             
@@ -96,48 +185,93 @@ class SnapshotAnalyzer(BaseAnalyzer):
             logger.error(f"Error fetching AMI information: {str(e)}")
             return set()
     
-    def _is_snapshot_outdated(self, snapshot, ami_snapshot_ids):
+    def _get_volume_states(self, volume_ids):
         """
-        Check if a snapshot is outdated
+        Get the current state of the volumes snapshots were taken from
+        
+        Volumes are looked up with the volume-id filter, up to 200 IDs per
+        call, so deleted volumes are simply missing instead of failing the call.
+        
+        Args:
+            volume_ids (set): Volume IDs (None values are ignored)
+            
+        Returns:
+            dict: Volume state (e.g., 'available', 'in-use') keyed by volume ID,
+                or None if the volumes could not be described
+        """
+        volume_ids = sorted(volume_id for volume_id in volume_ids if volume_id)
+        volume_states = {}
+        
+        try:
+            paginator = self.client.get_paginator('describe_volumes')
+            for i in range(0, len(volume_ids), FILTER_MAX_VALUES):
+                for page in paginator.paginate(
+                    Filters=[{'Name': 'volume-id', 'Values': volume_ids[i:i + FILTER_MAX_VALUES]}],
+                    PaginationConfig={'PageSize': 500}
+                ):
+                    for volume in page['Volumes']:
+                        volume_states[volume['VolumeId']] = volume['State']
+            
+            return volume_states
+            
+        except Exception as e:
+            logger.error(f"Error fetching source volumes of snapshots: {str(e)}")
+            return None
+    
+    def _is_snapshot_outdated(self, snapshot):
+        """
+        Check if a snapshot is older than the retention period
         
         Args:
             snapshot (dict): EBS snapshot details
-            ami_snapshot_ids (set): Set of snapshot IDs used by AMIs
             
         Returns:
             bool: True if snapshot is outdated
         """
-        snapshot_id = snapshot['SnapshotId']
-        
-        # Exclude AMI snapshots if configured
-        if self.exclude_ami_snapshots and snapshot_id in ami_snapshot_ids:
-            logger.debug(f"Snapshot {snapshot_id} is associated with an AMI")
+        # Younger than retention_days means started after the cutoff
+        if snapshot['StartTime'] > self._cutoff:
+            logger.debug("Snapshot %s started %s (within retention period)", snapshot['SnapshotId'], snapshot['StartTime'])
             return False
         
-        # Check snapshot age
-        start_time = snapshot['StartTime']
-        snapshot_age_days = (datetime.now(start_time.tzinfo) - start_time).days
+        return True
+    
+    def _is_ami_snapshot(self, snapshot, ami_snapshot_ids):
+        """
+        Check if a snapshot is used by an AMI
         
-        if snapshot_age_days < self.retention_days:
-            logger.debug(f"Snapshot {snapshot_id} is {snapshot_age_days} days old (below threshold)")
-            return False
+        Args:
+            snapshot (dict): EBS snapshot details
+            ami_snapshot_ids (set): Set of snapshot IDs used by AMIs
+            
+        Returns:
+            bool: True if snapshot is associated with an AMI
+        """
+        if snapshot['SnapshotId'] in ami_snapshot_ids:
+            logger.debug("Snapshot %s is associated with an AMI", snapshot['SnapshotId'])
+            return True
         
-        return True
+        return False
     
-    def _add_outdated_snapshot(self, snapshot):
+    def _add_outdated_snapshot(self, snapshot, volume_states=None):
         """
         Add outdated snapshot to findings
         
         Args:
             snapshot (dict): EBS snapshot details
+            volume_states (dict): Source volume states keyed by volume ID
+                (None if unknown)
         """
         snapshot_id = snapshot['SnapshotId']
         volume_id = snapshot.get('VolumeId', 'N/A')
+        if volume_states is None:
+            volume_state = 'unknown'
+        else:
+            volume_state = volume_states.get(volume_id, 'not-found')
         volume_size = snapshot['VolumeSize']
-        region = self.client.meta.region_name
+        region = sys.intern(self.client.meta.region_name)
         
         # Calculate cost
-        monthly_cost = self.cost_calculator.calculate_snapshot_cost(
+        monthly_cost = self._snapshot_cost(
             volume_size,
             region
         )
@@ -149,13 +283,14 @@ class SnapshotAnalyzer(BaseAnalyzer):
         
         # Calculate snapshot age
         start_time = snapshot['StartTime']
-        snapshot_age_days = (datetime.now(start_time.tzinfo) - start_time).days
+        snapshot_age_days = (self._now - start_time).days
         
         resource_data = {
             'snapshot_id': snapshot_id,
             'snapshot_name': snapshot_name,
             'description': description,
             'volume_id': volume_id,
+            'volume_state': sys.intern(volume_state),
             'size_gb': volume_size,
             'region': region,
             'state': snapshot['State'],
@@ -167,4 +302,5 @@ class SnapshotAnalyzer(BaseAnalyzer):
         }
         
         self.add_finding(resource_data)
-        logger.info(f"Found outdated snapshot: {snapshot_id} ({snapshot_name}) - {volume_size}GB - {snapshot_age_days} days old - ${monthly_cost:.2f}/month")
+        logger.info("Found outdated snapshot: %s (%s) - %dGB - %d days old - $%.2f/month",
+                    snapshot_id, snapshot_name, volume_size, snapshot_age_days, monthly_cost)
@@ -5,8 +5,14 @@ Main entry point for the application
 """
 
 import sys
+import atexit
 import logging
+import queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
 from pathlib import Path
 import click
 from rich.console import Console
@@ -20,6 +26,9 @@ from analyzers.eip_analyzer import EIPAnalyzer
 from analyzers.rds_analyzer import RDSAnalyzer
 from utils.config_loader import ConfigLoader
 from utils.aws_client import AWSClientManager
+from utils.tag_lookup import TagLookup
+from utils.api_cache import APICache, DEFAULT_CACHE_DIR
+from utils.json_parser import use_orjson_parser
 from reports.json_reporter import JSONReporter
 from reports.csv_reporter import CSVReporter
 from reports.html_reporter import HTMLReporter
@@ -28,23 +37,138 @@ from notifications.slack_notifier import SlackNotifier
 # Fix Windows console encoding issue with emojis
 console = Console(force_terminal=True, legacy_windows=False)
 
+# Analyzers run for each region: (result key, --resource-type value, console label)
+ANALYZERS = [
+    ('idle_ec2_instances', 'ec2', 'idle EC2 instances'),
+    ('unattached_ebs_volumes', 'ebs', 'unattached EBS volumes'),
+    ('outdated_snapshots', 'snapshots', 'outdated snapshots'),
+    ('unused_elastic_ips', 'eip', 'unused Elastic IPs'),
+    ('idle_rds_instances', 'rds', 'idle RDS instances'),
+]
+
+# Report generators: --output-format value -> (reporter class, console message,
+# whether the combined results are passed as well)
+REPORTERS = {
+    'json': (JSONReporter, 'JSON report generated', False),
+    'csv': (CSVReporter, 'CSV reports generated', False),
+    'html': (HTMLReporter, 'HTML report generated', True),
+}
+
 
 def setup_logging(config):
-    """Setup logging configuration"""
+    """
+    Setup logging configuration
+    
+    Log records are put on a queue and written to the file and console by a
+    background listener, so analyzer threads never wait on log I/O.
+    """
     log_level = getattr(logging, config.get('logging', {}).get('level', 'INFO'))
     log_file = config.get('logging', {}).get('file', 'logs/cost-optimizer.log')
     
     # Create logs directory if it doesn't exist
     Path(log_file).parent.mkdir(parents=True, exist_ok=True)
     
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler() if config.get('logging', {}).get('console', True) else logging.NullHandler()
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    stream_handler = logging.StreamHandler() if config.get('logging', {}).get('console', True) else logging.NullHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    # Flush whatever is still queued when the program exits
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+
+def create_analyzer(result_key, get_client, app_config, tag_lookup, api_cache):
+    """
+    Create the analyzer producing a given result key
+    
+    Args:
+        result_key (str): Result key of the analyzer (see ANALYZERS)
+        get_client (callable): Returns the region's client for a service name
+        app_config (dict): Application configuration
+        tag_lookup (TagLookup): Tag index used to narrow describe calls (optional)
+        api_cache (APICache): Disk cache for API responses (optional)
+        
+    Returns:
+        BaseAnalyzer: Analyzer instance
+    """
+    if result_key == 'idle_ec2_instances':
+        return EC2Analyzer(get_client('ec2'), get_client('cloudwatch'), app_config, tag_lookup, api_cache)
+    if result_key == 'unattached_ebs_volumes':
+        return EBSAnalyzer(get_client('ec2'), app_config, tag_lookup, api_cache)
+    if result_key == 'outdated_snapshots':
+        return SnapshotAnalyzer(get_client('ec2'), app_config, api_cache)
+    if result_key == 'unused_elastic_ips':
+        return EIPAnalyzer(get_client('ec2'), app_config, tag_lookup, api_cache)
+    return RDSAnalyzer(get_client('rds'), get_client('cloudwatch'), app_config, tag_lookup, api_cache)
+
+
+def analyze_region(aws_manager, aws_region, result_keys, app_config, account_id):
+    """
+    Run the selected analyzers for one region
+    
+    The analyzers run side by side in threads sharing the region's clients.
+    The client manager (and its session) is shared by all regions, so
+    credentials are resolved once per run.
+    
+    Args:
+        aws_manager (AWSClientManager): Client manager shared by all regions
+        aws_region (str): AWS region
+        result_keys (list): Result keys of the analyzers to run
+        app_config (dict): Application configuration
+        account_id (str): AWS account ID for the API cache (None if disabled)
+        
+    Returns:
+        dict: Analysis results keyed by result key
+    """
+    def get_client(service_name):
+        return aws_manager.get_client(service_name, aws_region)
+    
+    # Narrow describe calls to tagged candidates if the tag index is enabled
+    tag_lookup = None
+    tag_index_config = app_config.get('tag_index', {})
+    if tag_index_config.get('enabled'):
+        tag_lookup = TagLookup(
+            get_client('resourcegroupstaggingapi'),
+            tag_index_config.get('tag_filters', {})
+        )
+    
+    # Serve describe and metric calls from disk while cached responses are fresh
+    api_cache = None
+    if account_id:
+        cache_config = app_config.get('cache', {})
+        api_cache = APICache(
+            account_id,
+            cache_dir=cache_config.get('directory', DEFAULT_CACHE_DIR),
+            ttl_seconds=cache_config.get('ttl_seconds', 300),
+            metrics_ttl_seconds=cache_config.get('metrics_ttl_seconds', 60)
+        )
+    
+    analyzers = {
+        result_key: create_analyzer(
+            result_key,
+            get_client,
+            app_config,
+            tag_lookup,
+            api_cache
+        )
+        for result_key in result_keys
+    }
+    
+    analyzer_threads = app_config.get('parallel', {}).get('analyzer_threads', 5)
+    with ThreadPoolExecutor(max_workers=max(1, min(analyzer_threads, len(analyzers)))) as executor:
+        futures = {
+            result_key: executor.submit(analyzer.analyze)
+            for result_key, analyzer in analyzers.items()
+        }
+        return {result_key: future.result() for result_key, future in futures.items()}
 
 
 def print_summary(results):
@@ -63,18 +187,18 @@ def print_summary(results):
     table.add_column("Count", justify="right", style="yellow")
     table.add_column("Potential Monthly Savings", justify="right", style="green")
     
-    total_savings = 0.0
-    
-    for resource_type, data in results.items():
-        count = len(data.get('resources', []))
-        savings = data.get('total_savings', 0.0)
-        total_savings += savings
-        
-        table.add_row(
+    rows = [
+        (
             resource_type.replace('_', ' ').title(),
-            str(count),
-            f"${savings:.2f}"
+            str(len(data['resources'])),
+            f"${data['total_savings']:.2f}"
         )
+        for resource_type, data in results.items()
+    ]
+    for row in rows:
+        table.add_row(*row)
+    
+    total_savings = sum(map(itemgetter('total_savings'), results.values()))
     
     console.print("\n", table)
     
@@ -123,6 +247,8 @@ def main(config, profile, region, all_regions, resource_type, dry_run, output_fo
         if verbose:
             app_config['logging']['level'] = 'DEBUG'
         setup_logging(app_config)
+        if app_config['aws'].get('use_orjson', True):
+            use_orjson_parser()
         
         logger = logging.getLogger(__name__)
         logger.info("Starting AWS Cost Optimization Analysis")
@@ -142,67 +268,49 @@ def main(config, profile, region, all_regions, resource_type, dry_run, output_fo
         console.print(f"\n[bold]Analyzing regions:[/bold] {', '.join(regions)}")
         console.print(f"[bold]Resource types:[/bold] {resource_type}\n")
         
-        # Initialize analyzers
+        # Select analyzers for the requested resource types
+        selected_analyzers = [
+            (result_key, label)
+            for result_key, option, label in ANALYZERS
+            if resource_type in (option, 'all')
+        ]
+        result_keys = [result_key for result_key, _ in selected_analyzers]
+        region_threads = app_config.get('parallel', {}).get('region_threads', 32)
+        
+        # Cached responses are keyed by account, so look it up once for all regions
+        account_id = None
+        if app_config.get('cache', {}).get('enabled', False):
+            account_id = aws_manager.get_account_id()
+            if not account_id:
+                logger.warning("Could not determine AWS account ID, API cache disabled")
+        
         all_results = {}
+        # Totals across regions, accumulated as each region's results arrive
+        combined_results = defaultdict(lambda: {'resources': [], 'total_savings': 0.0})
         
-        for aws_region in regions:
-            console.print(f"\n[bold cyan]Analyzing region: {aws_region}[/bold cyan]")
-            
-            ec2_client = aws_manager.get_client('ec2', aws_region)
-            cloudwatch_client = aws_manager.get_client('cloudwatch', aws_region)
-            
-            region_results = {}
-            
-            # Run EC2 analysis
-            if resource_type in ['ec2', 'all']:
-                with console.status("[bold green]Analyzing EC2 instances..."):
-                    ec2_analyzer = EC2Analyzer(ec2_client, cloudwatch_client, app_config)
-                    region_results['idle_ec2_instances'] = ec2_analyzer.analyze()
-                    console.print(f"✓ Found {len(region_results['idle_ec2_instances']['resources'])} idle EC2 instances")
-            
-            # Run EBS analysis
-            if resource_type in ['ebs', 'all']:
-                with console.status("[bold green]Analyzing EBS volumes..."):
-                    ebs_analyzer = EBSAnalyzer(ec2_client, app_config)
-                    region_results['unattached_ebs_volumes'] = ebs_analyzer.analyze()
-                    console.print(f"✓ Found {len(region_results['unattached_ebs_volumes']['resources'])} unattached EBS volumes")
-            
-            # Run Snapshot analysis
-            if resource_type in ['snapshots', 'all']:
-                with console.status("[bold green]Analyzing EBS snapshots..."):
-                    snapshot_analyzer = SnapshotAnalyzer(ec2_client, app_config)
-                    region_results['outdated_snapshots'] = snapshot_analyzer.analyze()
-                    console.print(f"✓ Found {len(region_results['outdated_snapshots']['resources'])} outdated snapshots")
-            
-            # Run Elastic IP analysis
-            if resource_type in ['eip', 'all']:
-                with console.status("[bold green]Analyzing Elastic IPs..."):
-                    eip_analyzer = EIPAnalyzer(ec2_client, app_config)
-                    region_results['unused_elastic_ips'] = eip_analyzer.analyze()
-                    console.print(f"✓ Found {len(region_results['unused_elastic_ips']['resources'])} unused Elastic IPs")
-            
-            # Run RDS analysis
-            if resource_type in ['rds', 'all']:
-                with console.status("[bold green]Analyzing RDS instances..."):
-                    rds_client = aws_manager.get_client('rds', aws_region)
-                    rds_analyzer = RDSAnalyzer(rds_client, cloudwatch_client, app_config)
-                    region_results['idle_rds_instances'] = rds_analyzer.analyze()
-                    console.print(f"✓ Found {len(region_results['idle_rds_instances']['resources'])} idle RDS instances")
-            
-            all_results[aws_region] = region_results
+        # Regions and their analyzers are independent and I/O bound, so they
+        # all run side by side in threads
+        with console.status(f"[bold green]Running {len(selected_analyzers)} analyzers in {len(regions)} regions..."):
+            with ThreadPoolExecutor(max_workers=max(1, min(region_threads, len(regions)))) as executor:
+                futures = {
+                    aws_region: executor.submit(analyze_region, aws_manager, aws_region, result_keys, app_config, account_id)
+                    for aws_region in regions
+                }
+                for aws_region, future in futures.items():
+                    region_results = all_results[aws_region] = future.result()
+                    for resource_type_key, data in region_results.items():
+                        combined = combined_results[resource_type_key]
+                        combined['resources'].extend(data['resources'])
+                        combined['total_savings'] += data['total_savings']
         
-        # Print summary
-        combined_results = {}
+        # Report per-region findings in region order once everything has finished
         for aws_region, region_results in all_results.items():
-            for resource_type_key, data in region_results.items():
-                if resource_type_key not in combined_results:
-                    combined_results[resource_type_key] = {
-                        'resources': [],
-                        'total_savings': 0.0
-                    }
-                combined_results[resource_type_key]['resources'].extend(data['resources'])
-                combined_results[resource_type_key]['total_savings'] += data['total_savings']
+            console.print(f"\n[bold cyan]Analyzed region: {aws_region}[/bold cyan]")
+            for result_key, label in selected_analyzers:
+                console.print(f"✓ Found {len(region_results[result_key]['resources'])} {label}")
         
+        # Print summary
+        combined_results = dict(combined_results)
         print_summary(combined_results)
         
         # Generate reports
@@ -215,27 +323,26 @@ def main(config, profile, region, all_regions, resource_type, dry_run, output_fo
         
         formats = [output_format] if output_format != 'all' else app_config['reports'].get('formats', ['json', 'csv', 'html'])
         
+        # Reporters run one at a time: the HTML reporter draws its charts with
+        # matplotlib, which is not thread-safe
         for fmt in formats:
-            if fmt == 'json':
-                reporter = JSONReporter(report_dir)
-                reporter.generate(all_results)
-                console.print(f"✓ JSON report generated")
-            elif fmt == 'csv':
-                reporter = CSVReporter(report_dir)
-                reporter.generate(all_results)
-                console.print(f"✓ CSV reports generated")
-            elif fmt == 'html':
-                reporter = HTMLReporter(report_dir)
-                reporter.generate(all_results, combined_results)
-                console.print(f"✓ HTML report generated")
+            if fmt not in REPORTERS:
+                logger.warning(f"Unknown report format '{fmt}', skipping")
+                continue
+            reporter_class, message, include_summary = REPORTERS[fmt]
+            args = (all_results, combined_results) if include_summary else (all_results,)
+            reporter_class(report_dir).generate(*args)
+            console.print(f"✓ {message}")
         
         # Send Slack notification if configured
         try:
             slack_config = app_config.get('notifications', {}).get('slack', {})
-            webhook_url = slack_config.get('webhook_url', '').strip()
+            slack_notifier = SlackNotifier(
+                slack_config.get('webhook_url', ''),
+                slack_config.get('webhook_urls', [])
+            )
             
-            if webhook_url:
-                slack_notifier = SlackNotifier(webhook_url)
+            if slack_notifier.enabled:
                 slack_notifier.send_findings(combined_results)
         except Exception as e:
             logger.warning(f"Failed to send Slack notification: {str(e)}")
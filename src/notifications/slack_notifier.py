@@ -6,23 +6,109 @@ Sends cost optimization findings to Slack
 import json
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Display settings per result key, in message order
+RESOURCE_CONFIG = {
+    'idle_ec2_instances': {
+        'label': 'Idle EC2 Instances',
+        'emoji': '💤',
+        'color': '#FF6B6B'
+    },
+    'unattached_ebs_volumes': {
+        'label': 'Unattached EBS Volumes',
+        'emoji': '💾',
+        'color': '#4ECDC4'
+    },
+    'outdated_snapshots': {
+        'label': 'Outdated Snapshots',
+        'emoji': '📸',
+        'color': '#95E1D3'
+    },
+    'unused_elastic_ips': {
+        'label': 'Unused Elastic IPs',
+        'emoji': '🌐',
+        'color': '#FFE66D'
+    },
+    'idle_rds_instances': {
+        'label': 'Idle RDS Databases',
+        'emoji': '🗄️',
+        'color': '#A8E6CF'
+    }
+}
+
+# Static message blocks, shared by every message
+HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "AWS Cost Optimization Report",
+        "emoji": True
+    }
+}
+
+DIVIDER_BLOCK = {
+    "type": "divider"
+}
+
+DETAILS_HEADING_BLOCK = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*Detailed Findings*"
+    }
+}
+
+FOOTER_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "*Recommended Actions*\n• Review identified idle resources\n• Verify they are not needed\n• Stop or delete to reduce costs\n• Monitor for future optimization opportunities"
+        }
+    },
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "💡 This is an automated cost optimization analysis. Please review findings before taking action."
+            }
+        ]
+    }
+]
+
 
 class SlackNotifier:
-    """Sends notifications to Slack webhook"""
+    """Sends notifications to Slack webhooks"""
     
-    def __init__(self, webhook_url=None):
+    def __init__(self, webhook_url=None, webhook_urls=None):
         """
         Initialize Slack Notifier
         
         Args:
             webhook_url (str): Slack incoming webhook URL (optional)
+            webhook_urls (list): Additional webhook URLs, e.g. one per team (optional)
         """
         self.webhook_url = webhook_url
-        self.enabled = bool(webhook_url and webhook_url.strip())
+        self.webhook_urls = [
+            url.strip()
+            for url in [webhook_url] + list(webhook_urls or [])
+            if url and url.strip()
+        ]
+        self.enabled = bool(self.webhook_urls)
+        
+        # Reused across notifications so the TLS connection is kept alive
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
     
     def send_findings(self, combined_results):
         """
@@ -67,35 +153,7 @@ class SlackNotifier:
         total_monthly_savings = 0.0
         finding_sections = []
         
-        resource_config = {
-            'idle_ec2_instances': {
-                'label': 'Idle EC2 Instances',
-                'emoji': '💤',
-                'color': '#FF6B6B'
-            },
-            'unattached_ebs_volumes': {
-                'label': 'Unattached EBS Volumes',
-                'emoji': '💾',
-                'color': '#4ECDC4'
-            },
-            'outdated_snapshots': {
-                'label': 'Outdated Snapshots',
-                'emoji': '📸',
-                'color': '#95E1D3'
-            },
-            'unused_elastic_ips': {
-                'label': 'Unused Elastic IPs',
-                'emoji': '🌐',
-                'color': '#FFE66D'
-            },
-            'idle_rds_instances': {
-                'label': 'Idle RDS Databases',
-                'emoji': '🗄️',
-                'color': '#A8E6CF'
-            }
-        }
-        
-        for resource_type, config in resource_config.items():
+        for resource_type, config in RESOURCE_CONFIG.items():
             if resource_type in combined_results:
                 resources = combined_results[resource_type].get('resources', [])
                 if resources:
@@ -124,15 +182,7 @@ class SlackNotifier:
         
         # Build the full message with professional formatting
         blocks = [
-            # Header
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "AWS Cost Optimization Report",
-                    "emoji": True
-                }
-            },
+            HEADER_BLOCK,
             
             # Summary section
             {
@@ -143,9 +193,7 @@ class SlackNotifier:
                 }
             },
             
-            {
-                "type": "divider"
-            },
+            DIVIDER_BLOCK,
             
             # Key metrics
             {
@@ -170,61 +218,53 @@ class SlackNotifier:
                 ]
             },
             
-            {
-                "type": "divider"
-            }
+            DIVIDER_BLOCK
         ]
         
         # Add detailed findings
         if finding_sections:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*Detailed Findings*"
-                }
-            })
+            blocks.append(DETAILS_HEADING_BLOCK)
             blocks.extend(finding_sections)
-            
-            blocks.append({
-                "type": "divider"
-            })
+            blocks.append(DIVIDER_BLOCK)
         
         # Call to action
         if total_findings > 0:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*Recommended Actions*\n• Review identified idle resources\n• Verify they are not needed\n• Stop or delete to reduce costs\n• Monitor for future optimization opportunities"
-                }
-            })
-            
-            blocks.append({
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "💡 This is an automated cost optimization analysis. Please review findings before taking action."
-                    }
-                ]
-            })
+            blocks.extend(FOOTER_BLOCKS)
         
         return {"blocks": blocks}
     
     def _post_to_slack(self, message):
         """
-        Post message to Slack webhook
+        Post message to every configured Slack webhook
+        
+        The payload is serialized once; several webhooks are posted to
+        concurrently, so they finish in about one round trip.
         
         Args:
             message (dict): Message payload
         """
+        # orjson is optional; it returns UTF-8 bytes, json.dumps returns str
+        payload = orjson.dumps(message) if orjson is not None else json.dumps(message)
+        
+        if len(self.webhook_urls) == 1:
+            self._post_payload(self.webhook_urls[0], payload)
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(self.webhook_urls)) as executor:
+            list(executor.map(lambda url: self._post_payload(url, payload), self.webhook_urls))
+    
+    def _post_payload(self, webhook_url, payload):
+        """
+        Post a serialized message to one Slack webhook
+        
+        Args:
+            webhook_url (str): Slack incoming webhook URL
+            payload (bytes): JSON message payload
+        """
         try:
-            headers = {"Content-Type": "application/json"}
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(message),
-                headers=headers,
+            response = self._session.post(
+                webhook_url,
+                data=payload,
                 timeout=10
             )
             
@@ -0,0 +1,132 @@
+"""
+API Cache
+Disk-backed TTL cache for AWS API responses
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = '~/.aws-cost-optimizer/cache'
+
+
+def _encode(value):
+    """Encode values json cannot serialize natively (boto3 returns datetimes)"""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode(obj):
+    """Restore datetimes written by _encode"""
+    if len(obj) == 1 and '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+
+class APICache:
+    """Caches AWS API responses on disk as gzip-compressed JSON"""
+    
+    def __init__(self, account_id, cache_dir=DEFAULT_CACHE_DIR, ttl_seconds=300,
+                 metrics_ttl_seconds=60):
+        """
+        Initialize API Cache
+        
+        Args:
+            account_id (str): AWS account ID, used to keep accounts apart
+            cache_dir (str): Directory holding cache files
+            ttl_seconds (int): Default time-to-live for describe responses
+            metrics_ttl_seconds (int): Time-to-live for CloudWatch metrics
+        """
+        self.account_id = account_id
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self.metrics_ttl_seconds = metrics_ttl_seconds
+    
+    def get(self, key, ttl_seconds=None):
+        """
+        Get a cached value if it is still fresh
+        
+        Args:
+            key (tuple): Cache key, e.g. (region, api_name, params)
+            ttl_seconds (int): Maximum age in seconds (defaults to ttl_seconds)
+            
+        Returns:
+            object: Cached value, or None on a miss or expired entry
+        """
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > ttl_seconds:
+                return None
+            
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                value = json.load(f, object_hook=_decode)
+            
+            logger.debug(f"API cache hit: {path.name}")
+            return value
+            
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {str(e)}")
+            return None
+    
+    def set(self, key, value):
+        """
+        Store a value in the cache
+        
+        Args:
+            key (tuple): Cache key, e.g. (region, api_name, params)
+            value: JSON-serializable value (datetimes are supported)
+        """
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                    json.dump(value, f, default=_encode)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+                
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write cache file {path}: {str(e)}")
+    
+    def _path(self, key):
+        """
+        Build the cache file path for a key
+        
+        The first two key parts (region and API name) are kept readable;
+        anything else, such as request parameters, is reduced to a digest.
+        
+        Args:
+            key (tuple): Cache key
+            
+        Returns:
+            Path: Cache file path
+        """
+        region, api_name = key[0], key[1]
+        name = f"{self.account_id}_{region}_{api_name}"
+        
+        if len(key) > 2:
+            params = json.dumps(key[2:], sort_keys=True, default=_encode)
+            name += '_' + hashlib.sha1(params.encode('utf-8')).hexdigest()[:12]
+        
+        return self.cache_dir / f"{name}.json.gz"
@@ -3,16 +3,25 @@ AWS Client Manager
 Handles AWS client initialization and session management
 """
 
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Back off adaptively when describe calls get throttled, and keep enough
+# pooled connections for the analyzer threads sharing a client
+CLIENT_RETRIES = {'max_attempts': 10, 'mode': 'adaptive'}
+MAX_POOL_CONNECTIONS = 50
+
 
 class AWSClientManager:
     """Manages AWS client connections and sessions"""
     
+    __slots__ = (
+        'profile', 'regions', 'session', 'client_config',
+        '_clients', '_resources', '_lock', '_all_regions', '_identity'
+    )
+    
     def __init__(self, profile=None, regions=None):
         """
         Initialize AWS Client Manager
@@ -24,14 +33,29 @@ class AWSClientManager:
         self.profile = profile
         self.regions = regions or ['us-east-1']
         self.session = None
+        self.client_config = None
+        # Clients and resources are reused per (service, region); the lock also
+        # serializes use of the session, which is not thread-safe
+        self._clients = {}
+        self._resources = {}
+        self._lock = threading.Lock()
+        self._all_regions = None
+        self._identity = None
         self._initialize_session()
     
     def _initialize_session(self):
         """Initialize boto3 session"""
+        # boto3 is slow to import, so it is only loaded once AWS is actually used
+        import boto3
+        from botocore.config import Config
+        from botocore.exceptions import NoCredentialsError
+        
+        self.client_config = Config(retries=CLIENT_RETRIES, max_pool_connections=MAX_POOL_CONNECTIONS)
+        
         try:
             if self.profile:
                 self.session = boto3.Session(profile_name=self.profile)
-                logger.info(f"Initialized AWS session with profile: {self.profile}")
+                logger.info("Initialized AWS session with profile: %s", self.profile)
             else:
                 self.session = boto3.Session()
                 logger.info("Initialized AWS session with default credentials")
@@ -39,13 +63,15 @@ class AWSClientManager:
             logger.error("AWS credentials not found")
             raise
         except Exception as e:
-            logger.error(f"Failed to initialize AWS session: {str(e)}")
+            logger.error("Failed to initialize AWS session: %s", e)
             raise
     
     def get_client(self, service_name, region=None):
         """
         Get AWS service client
         
+        Clients are created once per service and region and then reused.
+        
         Args:
             service_name (str): AWS service name (e.g., 'ec2', 'cloudwatch')
             region (str): AWS region (uses default if not specified)
@@ -54,18 +80,25 @@ class AWSClientManager:
             boto3.client: AWS service client
         """
         try:
-            region = region or self.regions[0]
-            client = self.session.client(service_name, region_name=region)
-            logger.debug(f"Created {service_name} client for region {region}")
+            key = (service_name, region or self.regions[0])
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = self.session.client(
+                        service_name, region_name=key[1], config=self.client_config
+                    )
+                    logger.debug("Created %s client for region %s", service_name, key[1])
             return client
         except Exception as e:
-            logger.error(f"Failed to create {service_name} client: {str(e)}")
+            logger.error("Failed to create %s client: %s", service_name, e)
             raise
     
     def get_resource(self, service_name, region=None):
         """
         Get AWS service resource
         
+        Resources are created once per service and region and then reused.
+        
         Args:
             service_name (str): AWS service name (e.g., 'ec2', 's3')
             region (str): AWS region (uses default if not specified)
@@ -74,29 +107,42 @@ class AWSClientManager:
             boto3.resource: AWS service resource
         """
         try:
-            region = region or self.regions[0]
-            resource = self.session.resource(service_name, region_name=region)
-            logger.debug(f"Created {service_name} resource for region {region}")
+            key = (service_name, region or self.regions[0])
+            with self._lock:
+                resource = self._resources.get(key)
+                if resource is None:
+                    resource = self._resources[key] = self.session.resource(
+                        service_name, region_name=key[1], config=self.client_config
+                    )
+                    logger.debug("Created %s resource for region %s", service_name, key[1])
             return resource
         except Exception as e:
-            logger.error(f"Failed to create {service_name} resource: {str(e)}")
+            logger.error("Failed to create %s resource: %s", service_name, e)
             raise
     
     def get_all_regions(self):
         """
         Get all available AWS regions for EC2
         
+        The region list is fetched once per manager and then reused.
+        
         Returns:
             list: List of region names
         """
+        from botocore.exceptions import ClientError
+        
+        if self._all_regions is not None:
+            return list(self._all_regions)
+        
         try:
             ec2_client = self.get_client('ec2')
             response = ec2_client.describe_regions()
             regions = [region['RegionName'] for region in response['Regions']]
-            logger.info(f"Found {len(regions)} available regions")
+            logger.info("Found %d available regions", len(regions))
+            self._all_regions = tuple(regions)
             return regions
         except ClientError as e:
-            logger.error(f"Failed to get regions: {str(e)}")
+            logger.error("Failed to get regions: %s", e)
             return self.regions
     
     def validate_credentials(self):
@@ -107,12 +153,11 @@ class AWSClientManager:
             bool: True if credentials are valid
         """
         try:
-            sts_client = self.get_client('sts')
-            response = sts_client.get_caller_identity()
-            logger.info(f"Credentials validated for account: {response['Account']}")
+            response = self._get_caller_identity()
+            logger.info("Credentials validated for account: %s", response['Account'])
             return True
         except Exception as e:
-            logger.error(f"Credential validation failed: {str(e)}")
+            logger.error("Credential validation failed: %s", e)
             return False
     
     def get_account_id(self):
@@ -123,9 +168,19 @@ class AWSClientManager:
             str: AWS account ID
         """
         try:
-            sts_client = self.get_client('sts')
-            response = sts_client.get_caller_identity()
+            response = self._get_caller_identity()
             return response['Account']
         except Exception as e:
-            logger.error(f"Failed to get account ID: {str(e)}")
+            logger.error("Failed to get account ID: %s", e)
             return None
+    
+    def _get_caller_identity(self):
+        """
+        Get the STS caller identity, calling STS only the first time
+        
+        Returns:
+            dict: get_caller_identity response (Account, Arn, UserId)
+        """
+        if self._identity is None:
+            self._identity = self.get_client('sts').get_caller_identity()
+        return self._identity
@@ -3,12 +3,121 @@ Configuration Loader
 Handles loading and validating configuration files
 """
 
-import yaml
+import copy
+import functools
+import json
 import logging
+import os
+import sys
+import tempfile
 from pathlib import Path
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Sections validate_config() requires
+REQUIRED_SECTIONS = ('aws', 'ec2', 'ebs', 'snapshots', 'reports')
+
+# Allowed ranges checked by validate_config(): (section, key, minimum, maximum);
+# keys missing from the config are not checked
+VALUE_RANGES = (
+    ('ec2', 'cpu_threshold', 0, 100),
+    ('rds', 'cpu_threshold', 0, 100),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(yaml_path, mtime_ns):
+    """
+    Parse a YAML file, reusing a JSON copy of the result when it is fresh
+    
+    The parsed data is saved next to the YAML file (e.g. config.yaml.json)
+    and used instead of the YAML until the YAML file is modified again. The
+    copy may hold secrets such as webhook URLs, so it is readable by the
+    owner only.
+    Results are also kept in memory, keyed by path and modification time.
+    
+    Args:
+        yaml_path (str): Absolute path to the YAML file
+        mtime_ns (int): Modification time of the YAML file in nanoseconds
+        
+    Returns:
+        dict: Parsed YAML data (shared, callers must not modify it)
+    """
+    yaml_path = Path(yaml_path)
+    cache_path = yaml_path.with_name(yaml_path.name + '.json')
+    
+    try:
+        if cache_path.stat().st_mtime_ns >= mtime_ns:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        # No usable cached copy
+        pass
+    
+    # Imported here so runs served from the JSON copy never load PyYAML
+    import yaml
+    
+    # Parse with the libyaml C extension when PyYAML was built with it
+    yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    # Binary mode lets libyaml detect the encoding and decode the bytes itself
+    with open(yaml_path, 'rb') as f:
+        data = yaml.load(f, Loader=yaml_loader)
+    
+    # Only cache data that survives the JSON round trip unchanged (YAML
+    # dates or non-string keys would not)
+    try:
+        cached = json.dumps(data)
+        if json.loads(cached) == data:
+            # Write to a private temporary file first so readers never see a
+            # partial copy (mkstemp creates it with 0600 permissions)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(cached)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Not caching parsed {yaml_path}: {str(e)}")
+    
+    return data
+
+
+def _freeze(value):
+    """
+    Make parsed data read-only, interning its string keys
+    
+    Args:
+        value: Parsed YAML value
+        
+    Returns:
+        Nested dicts as MappingProxyType views with interned keys, other
+        values unchanged
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({
+            (sys.intern(key) if isinstance(key, str) else key): _freeze(item)
+            for key, item in value.items()
+        })
+    return value
+
+
+@functools.lru_cache(maxsize=32)
+def _load_frozen_yaml(yaml_path, mtime_ns):
+    """
+    Parse a YAML file into read-only mappings, once per path and modification time
+    
+    Args:
+        yaml_path (str): Absolute path to the YAML file
+        mtime_ns (int): Modification time of the YAML file in nanoseconds
+        
+    Returns:
+        MappingProxyType: Parsed YAML data (shared between callers)
+    """
+    return _freeze(_parse_yaml(yaml_path, mtime_ns))
+
 
 class ConfigLoader:
     """Loads and validates configuration"""
@@ -31,50 +140,68 @@ class ConfigLoader:
             dict: Configuration dictionary
         """
         try:
-            if not self.config_path.exists():
-                logger.warning(f"Config file not found: {self.config_path}")
-                logger.info("Using default configuration")
-                return self._get_default_config()
-            
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            self.config = self._read_yaml(self.config_path)
             
             logger.info(f"Configuration loaded from: {self.config_path}")
             return self.config
             
-        except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML configuration: {str(e)}")
-            raise
+        except FileNotFoundError:
+            logger.warning(f"Config file not found: {self.config_path}")
+            logger.info("Using default configuration")
+            return self._get_default_config()
         except Exception as e:
-            logger.error(f"Error loading configuration: {str(e)}")
+            # PyYAML is loaded lazily, so its error type is only looked up here
+            import yaml
+            if isinstance(e, yaml.YAMLError):
+                logger.error(f"Error parsing YAML configuration: {str(e)}")
+            else:
+                logger.error(f"Error loading configuration: {str(e)}")
             raise
     
     def load_pricing(self, pricing_path='config/pricing.yaml'):
         """
         Load pricing configuration
         
+        Pricing is only ever read, so it is returned as read-only mappings
+        with interned keys.
+        
         Args:
             pricing_path (str): Path to pricing configuration file
             
         Returns:
-            dict: Pricing configuration dictionary
+            MappingProxyType: Pricing configuration mapping
         """
         try:
             pricing_file = Path(pricing_path)
-            
-            if not pricing_file.exists():
-                logger.warning(f"Pricing file not found: {pricing_file}")
-                return self._get_default_pricing()
-            
-            with open(pricing_file, 'r') as f:
-                pricing = yaml.safe_load(f)
+            # Read-only, so the cached mapping is returned without copying
+            resolved_path = pricing_file.resolve()
+            pricing = _load_frozen_yaml(str(resolved_path), resolved_path.stat().st_mtime_ns)
             
             logger.info(f"Pricing data loaded from: {pricing_file}")
             return pricing
             
+        except FileNotFoundError:
+            logger.warning(f"Pricing file not found: {pricing_file}")
+            return _freeze(self._get_default_pricing())
         except Exception as e:
             logger.error(f"Error loading pricing data: {str(e)}")
-            return self._get_default_pricing()
+            return _freeze(self._get_default_pricing())
+    
+    def _read_yaml(self, yaml_path):
+        """
+        Parse a YAML file, returning a copy the caller may modify
+        
+        Args:
+            yaml_path (Path): Path to the YAML file
+            
+        Returns:
+            dict: Parsed YAML data
+            
+        Raises:
+            FileNotFoundError: If the YAML file does not exist
+        """
+        yaml_path = yaml_path.resolve()
+        return copy.deepcopy(_parse_yaml(str(yaml_path), yaml_path.stat().st_mtime_ns))
     
     def _get_default_config(self):
         """
@@ -163,16 +290,19 @@ class ConfigLoader:
             return False
         
         # Validate required sections
-        required_sections = ['aws', 'ec2', 'ebs', 'snapshots', 'reports']
-        for section in required_sections:
+        for section in REQUIRED_SECTIONS:
             if section not in self.config:
                 logger.error(f"Missing required configuration section: {section}")
                 return False
         
-        # Validate threshold values
-        if self.config['ec2']['cpu_threshold'] < 0 or self.config['ec2']['cpu_threshold'] > 100:
-            logger.error("Invalid CPU threshold value (must be 0-100)")
-            return False
+        # Validate value ranges
+        for section, key, minimum, maximum in VALUE_RANGES:
+            value = (self.config.get(section) or {}).get(key)
+            if value is None:
+                continue
+            if not minimum <= value <= maximum:
+                logger.error(f"Invalid {section}.{key} value: {value} (must be {minimum}-{maximum})")
+                return False
         
         logger.info("Configuration validation passed")
         return True
@@ -4,6 +4,7 @@ Handles AWS cost estimation and calculations
 """
 
 import logging
+import numpy as np
 from utils.config_loader import ConfigLoader
 
 logger = logging.getLogger(__name__)
@@ -12,6 +13,11 @@ logger = logging.getLogger(__name__)
 class CostCalculator:
     """Calculates AWS resource costs and potential savings"""
     
+    __slots__ = (
+        'config', 'pricing', 'hours_per_month', '_pricing_index', '_family_matches',
+        '_ec2_region_rows', '_ec2_type_columns', '_ec2_rates'
+    )
+    
     def __init__(self, config, pricing_config=None):
         """
         Initialize Cost Calculator
@@ -30,6 +36,63 @@ class CostCalculator:
             self.pricing = pricing_config
         
         self.hours_per_month = self.pricing.get('hours_per_month', 730)
+        self._pricing_index = self._build_pricing_index(self.pricing.get('regions', {}))
+        # Family lookups of unpriced instance types: id(pricing) -> (pricing, {family: match})
+        self._family_matches = {}
+        # EC2 rate matrix, built by the first calculate_ec2_cost_bulk call
+        self._ec2_region_rows = None
+        self._ec2_type_columns = None
+        self._ec2_rates = None
+    
+    @staticmethod
+    def _build_pricing_index(regions):
+        """
+        Flatten region pricing into a lookup keyed by (region, resource type)
+        
+        Every listed region gets an entry for every known resource type, so a
+        listed region missing a section still resolves to an empty dict
+        rather than to the default region's prices.
+        
+        Args:
+            regions (dict): Pricing sections keyed by region name
+            
+        Returns:
+            dict: Pricing data keyed by (region, resource_type)
+        """
+        resource_types = {resource_type for sections in regions.values() for resource_type in sections}
+        return {
+            (region, resource_type): sections.get(resource_type, {})
+            for region, sections in regions.items()
+            for resource_type in resource_types
+        }
+    
+    def _build_ec2_rate_matrix(self, regions):
+        """
+        Store EC2 hourly rates as a region x instance type matrix
+        
+        Sets _ec2_region_rows and _ec2_type_columns (name -> index) and
+        _ec2_rates, with NaN where a region does not price a type (those
+        rates are estimated by calculate_ec2_cost_bulk as for single costs).
+        
+        Args:
+            regions (dict): Pricing sections keyed by region name
+        """
+        self._ec2_region_rows = {region: row for row, region in enumerate(regions)}
+        self._ec2_type_columns = {
+            instance_type: column
+            for column, instance_type in enumerate(sorted({
+                instance_type
+                for sections in regions.values()
+                for instance_type in sections.get('ec2', {})
+            }))
+        }
+        
+        self._ec2_rates = np.full((len(self._ec2_region_rows), len(self._ec2_type_columns)), np.nan)
+        for region, row in self._ec2_region_rows.items():
+            for instance_type, hourly_rate in regions[region].get('ec2', {}).items():
+                # A zero rate means "unknown" and is estimated like a missing one
+                if hourly_rate:
+                    self._ec2_rates[row, self._ec2_type_columns[instance_type]] = hourly_rate
     
     def get_region_pricing(self, region, resource_type):
         """
@@ -42,16 +105,14 @@ class CostCalculator:
         Returns:
             dict: Pricing data for the region and resource type
         """
-        regions = self.pricing.get('regions', {})
-        
         # Try to get region-specific pricing
-        if region in regions:
-            return regions[region].get(resource_type, {})
+        pricing = self._pricing_index.get((region, resource_type))
+        if pricing is not None:
+            return pricing
         
         # Fall back to default pricing
-        default_pricing = regions.get('default', {})
-        logger.debug(f"Using default pricing for {region}")
-        return default_pricing.get(resource_type, {})
+        logger.debug("Using default pricing for %s", region)
+        return self._pricing_index.get(('default', resource_type), {})
     
     def calculate_ec2_cost(self, instance_type, region, running_hours=None):
         """
@@ -65,21 +126,74 @@ class CostCalculator:
         Returns:
             float: Monthly cost in USD
         """
-        pricing = self.get_region_pricing(region, 'ec2')
+        if running_hours is None:
+            running_hours = self.hours_per_month
         
+        monthly_cost = self._ec2_hourly_rate(instance_type, region) * running_hours
+        logger.debug("EC2 cost for %s in %s: $%.2f/month", instance_type, region, monthly_cost)
+        
+        return monthly_cost
+    
+    def calculate_ec2_cost_bulk(self, instance_types, regions, running_hours=None):
+        """
+        Calculate EC2 instance costs for many instances at once
+        
+        Args:
+            instance_types (list): EC2 instance types
+            regions (list): AWS region of each instance
+            running_hours (float or numpy.ndarray): Hours running per month, for
+                all instances or per instance (default: full month)
+                
+        Returns:
+            numpy.ndarray: Monthly cost in USD of each instance
+        """
         if running_hours is None:
             running_hours = self.hours_per_month
         
+        if self._ec2_rates is None:
+            self._build_ec2_rate_matrix(self.pricing.get('regions', {}))
+        
+        # Unlisted regions use the default region's row, as in get_region_pricing
+        default_row = self._ec2_region_rows.get('default', -1)
+        rows = np.fromiter(
+            (self._ec2_region_rows.get(region, default_row) for region in regions),
+            dtype=np.intp,
+            count=len(regions)
+        )
+        columns = np.fromiter(
+            (self._ec2_type_columns.get(instance_type, -1) for instance_type in instance_types),
+            dtype=np.intp,
+            count=len(instance_types)
+        )
+        
+        # Gather the known rates, then estimate the rest one by one
+        hourly_rates = np.full(len(instance_types), np.nan)
+        known = (rows >= 0) & (columns >= 0)
+        hourly_rates[known] = self._ec2_rates[rows[known], columns[known]]
+        for index in np.flatnonzero(np.isnan(hourly_rates)):
+            hourly_rates[index] = self._ec2_hourly_rate(instance_types[index], regions[index])
+        
+        return hourly_rates * running_hours
+    
+    def _ec2_hourly_rate(self, instance_type, region):
+        """
+        Get the hourly rate of an EC2 instance type in a region
+        
+        Args:
+            instance_type (str): EC2 instance type
+            region (str): AWS region
+            
+        Returns:
+            float: Hourly rate in USD (estimated if the type is not priced)
+        """
+        pricing = self.get_region_pricing(region, 'ec2')
         hourly_rate = pricing.get(instance_type, 0.0)
         
         if hourly_rate == 0.0:
             # Try to estimate based on similar instance types
             hourly_rate = self._estimate_instance_cost(instance_type, pricing)
         
-        monthly_cost = hourly_rate * running_hours
-        logger.debug(f"EC2 cost for {instance_type} in {region}: ${monthly_cost:.2f}/month")
-        
-        return monthly_cost
+        return hourly_rate
     
     def calculate_ebs_cost(self, volume_type, volume_size_gb, region):
         """
@@ -94,10 +208,13 @@ class CostCalculator:
             float: Monthly cost in USD
         """
         pricing = self.get_region_pricing(region, 'ebs')
-        price_per_gb = pricing.get(volume_type, pricing.get('gp3', 0.08))
+        price_per_gb = pricing.get(volume_type)
+        if price_per_gb is None:
+            # Unknown volume types are priced like gp3
+            price_per_gb = pricing.get('gp3', 0.08)
         monthly_cost = price_per_gb * volume_size_gb
         
-        logger.debug(f"EBS cost for {volume_size_gb}GB {volume_type} in {region}: ${monthly_cost:.2f}/month")
+        logger.debug("EBS cost for %sGB %s in %s: $%.2f/month", volume_size_gb, volume_type, region, monthly_cost)
         
         return monthly_cost
     
@@ -116,7 +233,7 @@ class CostCalculator:
         price_per_gb = pricing.get('standard', 0.05)
         monthly_cost = price_per_gb * snapshot_size_gb
         
-        logger.debug(f"Snapshot cost for {snapshot_size_gb}GB in {region}: ${monthly_cost:.2f}/month")
+        logger.debug("Snapshot cost for %sGB in %s: $%.2f/month", snapshot_size_gb, region, monthly_cost)
         
         return monthly_cost
     
@@ -134,7 +251,7 @@ class CostCalculator:
         hourly_rate = pricing.get('unassociated', 0.005)  # ~$0.005/hour when not associated
         monthly_cost = hourly_rate * self.hours_per_month
         
-        logger.debug(f"Elastic IP cost in {region}: ${monthly_cost:.2f}/month")
+        logger.debug("Elastic IP cost in %s: $%.2f/month", region, monthly_cost)
         
         return monthly_cost
     
@@ -181,7 +298,7 @@ class CostCalculator:
         
         total_monthly_cost = instance_monthly_cost + storage_monthly_cost
         
-        logger.debug(f"RDS cost for {instance_class} ({engine}) in {region}: ${total_monthly_cost:.2f}/month")
+        logger.debug("RDS cost for %s (%s) in %s: $%.2f/month", instance_class, engine, region, total_monthly_cost)
         
         return total_monthly_cost
     
@@ -204,10 +321,11 @@ class CostCalculator:
             family = instance_class
         
         # Look for similar instances in the same family
-        for known_type, rate in pricing.items():
-            if known_type.startswith(family):
-                logger.warning(f"Using approximate pricing for {instance_class} based on {known_type}")
-                return rate
+        match = self._find_family_match(family, pricing)
+        if match is not None:
+            known_type, rate = match
+            logger.warning(f"Using approximate pricing for {instance_class} based on {known_type}")
+            return rate
         
         # Default fallback
         logger.warning(f"No pricing data found for {instance_class}, using default rate")
@@ -228,15 +346,46 @@ class CostCalculator:
         family = instance_type.split('.')[0] if '.' in instance_type else instance_type
         
         # Look for similar instances in the same family
-        for known_type, rate in pricing.items():
-            if known_type.startswith(family):
-                logger.warning(f"Using approximate pricing for {instance_type} based on {known_type}")
-                return rate
+        match = self._find_family_match(family, pricing)
+        if match is not None:
+            known_type, rate = match
+            logger.warning(f"Using approximate pricing for {instance_type} based on {known_type}")
+            return rate
         
         # Default fallback
         logger.warning(f"No pricing data found for {instance_type}, using default rate")
         return 0.05  # Default to $0.05/hour
     
+    def _find_family_match(self, family, pricing):
+        """
+        Find the first priced instance type belonging to a family
+        
+        The result is remembered per pricing dict and family, so repeated
+        misses for the same family do not scan the pricing again.
+        
+        Args:
+            family (str): Instance family prefix (e.g., 't3' or 'db.t3')
+            pricing (dict): Hourly rates keyed by instance type
+            
+        Returns:
+            tuple: (known_type, rate), or None if no type matches
+        """
+        if not pricing:
+            return None
+        
+        # The pricing dict is kept alongside its matches so its id is never reused
+        entry = self._family_matches.get(id(pricing))
+        if entry is None or entry[0] is not pricing:
+            entry = self._family_matches[id(pricing)] = (pricing, {})
+        matches = entry[1]
+        
+        if family not in matches:
+            matches[family] = next(
+                ((known_type, rate) for known_type, rate in pricing.items() if known_type.startswith(family)),
+                None
+            )
+        return matches[family]
+    
     def calculate_total_savings(self, resources):
         """
         Calculate total potential savings from multiple resources
@@ -247,7 +396,11 @@ class CostCalculator:
         Returns:
             dict: Summary of savings
         """
-        total_monthly = sum(r.get('monthly_cost', 0.0) for r in resources)
+        total_monthly = float(np.fromiter(
+            (r.get('monthly_cost', 0.0) for r in resources),
+            dtype=np.float64,
+            count=len(resources)
+        ).sum())
         total_annual = total_monthly * 12
         
         return {
@@ -266,4 +419,4 @@ class CostCalculator:
         Returns:
             str: Formatted cost string
         """
-        return f"${cost:.2f}"
+        return "$%.2f" % cost
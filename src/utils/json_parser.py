@@ -0,0 +1,46 @@
+"""
+JSON Parser
+Optional orjson-backed JSON decoding for botocore responses
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def use_orjson_parser():
+    """
+    Make botocore decode JSON response bodies with orjson
+    
+    Only services using a JSON wire protocol (e.g. the Resource Groups
+    Tagging API) are affected; EC2, RDS and CloudWatch responses are not JSON.
+    Safe to call more than once.
+    
+    Returns:
+        bool: True if orjson is in use, False if it is not installed
+    """
+    try:
+        import orjson
+    except ImportError:
+        logger.debug("orjson not installed, keeping the default JSON parser")
+        return False
+    
+    from botocore.parsers import BaseJSONParser
+    
+    if getattr(BaseJSONParser._parse_body_as_json, '_uses_orjson', False):
+        return True
+    
+    def _parse_body_as_json(self, body_contents):
+        if not body_contents:
+            return {}
+        try:
+            return orjson.loads(body_contents)
+        except orjson.JSONDecodeError:
+            # Same fallback as botocore: keep the raw body as the message
+            return {'message': body_contents.decode(self.DEFAULT_ENCODING)}
+    
+    _parse_body_as_json._uses_orjson = True
+    BaseJSONParser._parse_body_as_json = _parse_body_as_json
+    
+    logger.debug("Using orjson for botocore JSON responses")
+    return True
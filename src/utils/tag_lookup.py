@@ -0,0 +1,107 @@
+"""
+Tag Lookup
+Finds candidate resources by tag using the Resource Groups Tagging API
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Resource types the analyzers can narrow down with the tag index
+RESOURCE_TYPES = ['ec2:volume', 'ec2:instance', 'ec2:elastic-ip', 'rds:db']
+
+
+class TagLookup:
+    """Looks up IDs of resources matching tag filters in a single region"""
+    
+    def __init__(self, tagging_client, tag_filters):
+        """
+        Initialize Tag Lookup
+        
+        Args:
+            tagging_client: Boto3 Resource Groups Tagging API client
+            tag_filters (dict): Tag keys mapped to accepted values (a single
+                value, a list of values, or empty to match any value)
+        """
+        self.client = tagging_client
+        self.tag_filters = []
+        for key, values in (tag_filters or {}).items():
+            if values in (None, '', []):
+                self.tag_filters.append({'Key': key})
+            else:
+                values = values if isinstance(values, list) else [values]
+                self.tag_filters.append({'Key': key, 'Values': [str(value) for value in values]})
+        
+        self._resource_ids = None
+        # Analyzers of a region share the lookup from their own threads
+        self._lock = threading.Lock()
+    
+    def get_resource_ids(self, resource_type):
+        """
+        Get IDs of tagged resources of a given type
+        
+        All supported resource types are fetched in one paginated call the
+        first time this is used; later calls are served from memory. Safe to
+        call from several threads.
+        
+        Args:
+            resource_type (str): Resource type (e.g., 'ec2:volume', 'rds:db')
+            
+        Returns:
+            set: Matching resource IDs (e.g., volume IDs, DB identifiers)
+        """
+        with self._lock:
+            if self._resource_ids is None:
+                self._resource_ids = self._fetch_resource_ids()
+        
+        return self._resource_ids.get(resource_type, set())
+    
+    def _fetch_resource_ids(self):
+        """
+        Fetch tagged resources and group their IDs by resource type
+        
+        Returns:
+            dict: Sets of resource IDs keyed by resource type
+        """
+        try:
+            resource_ids = {resource_type: set() for resource_type in RESOURCE_TYPES}
+            paginator = self.client.get_paginator('get_resources')
+            
+            for page in paginator.paginate(
+                TagFilters=self.tag_filters,
+                ResourceTypeFilters=RESOURCE_TYPES,
+                ResourcesPerPage=100
+            ):
+                for mapping in page.get('ResourceTagMappingList', []):
+                    resource_type, resource_id = self._parse_arn(mapping['ResourceARN'])
+                    if resource_type in resource_ids:
+                        resource_ids[resource_type].add(resource_id)
+            
+            logger.info("Tag index matched " + ", ".join(
+                f"{len(ids)} {resource_type}" for resource_type, ids in resource_ids.items()
+            ))
+            return resource_ids
+            
+        except Exception as e:
+            logger.error(f"Error fetching resources from tag index: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _parse_arn(arn):
+        """
+        Split a resource ARN into resource type and resource ID
+        
+        Handles both 'service:...:type/id' (EC2) and 'service:...:type:id' (RDS) forms.
+        
+        Args:
+            arn (str): Resource ARN
+            
+        Returns:
+            tuple: (resource_type, resource_id), e.g. ('ec2:volume', 'vol-0abc')
+        """
+        parts = arn.split(':', 5)
+        service, resource = parts[2], parts[5]
+        separator = '/' if '/' in resource else ':'
+        resource_kind, _, resource_id = resource.partition(separator)
+        return f"{service}:{resource_kind}", resource_id
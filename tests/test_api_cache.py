@@ -0,0 +1,53 @@
+"""
+Test API Cache
+"""
+
+import os
+import time
+import pytest
+from datetime import datetime, timezone
+from utils.api_cache import APICache
+
+
+class TestAPICache:
+    """Test cases for APICache"""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """API cache writing to a temporary directory"""
+        return APICache('123456789012', cache_dir=tmp_path, ttl_seconds=300)
+    
+    def test_miss_returns_none(self, cache):
+        """Test that an unknown key is a cache miss"""
+        assert cache.get(('us-east-1', 'describe_volumes')) is None
+    
+    def test_round_trip_preserves_datetimes(self, cache):
+        """Test that stored responses come back unchanged, including datetimes"""
+        created = datetime(2024, 1, 15, 12, 30, tzinfo=timezone.utc)
+        volumes = [{'VolumeId': 'vol-1', 'Size': 100, 'CreateTime': created}]
+        
+        cache.set(('us-east-1', 'describe_volumes'), volumes)
+        
+        assert cache.get(('us-east-1', 'describe_volumes')) == volumes
+        assert list(cache.cache_dir.iterdir()) == [
+            cache.cache_dir / '123456789012_us-east-1_describe_volumes.json.gz'
+        ]
+    
+    def test_expired_entry_is_a_miss(self, cache):
+        """Test that entries older than the TTL are ignored"""
+        key = ('us-east-1', 'describe_volumes')
+        cache.set(key, [{'VolumeId': 'vol-1'}])
+        
+        path = cache._path(key)
+        stale = time.time() - 301
+        os.utime(path, (stale, stale))
+        
+        assert cache.get(key) is None
+        assert cache.get(key, ttl_seconds=600) == [{'VolumeId': 'vol-1'}]
+    
+    def test_params_are_part_of_the_key(self, cache):
+        """Test that different request parameters are cached separately"""
+        cache.set(('us-east-1', 'get_metric_data', ['i-1']), {'i-1': 2.5})
+        
+        assert cache.get(('us-east-1', 'get_metric_data', ['i-2'])) is None
+        assert cache.get(('us-east-1', 'get_metric_data', ['i-1'])) == {'i-1': 2.5}
@@ -0,0 +1,210 @@
+"""
+Test Base Analyzer
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from analyzers.base_analyzer import BaseAnalyzer
+from analyzers.ebs_analyzer import EBSAnalyzer
+from utils.api_cache import APICache
+
+
+class DummyAnalyzer(BaseAnalyzer):
+    """Minimal concrete analyzer for exercising BaseAnalyzer helpers"""
+    
+    def analyze(self):
+        return self.get_results()
+
+
+class TestBaseAnalyzer:
+    """Test cases for BaseAnalyzer"""
+    
+    @pytest.fixture
+    def config(self):
+        """Sample configuration for testing"""
+        return {
+            'pricing': {
+                'pricing_file': 'config/pricing.yaml'
+            },
+            'exclude_tags': {
+                'Environment': 'production',
+                'DoNotDelete': 'true'
+            }
+        }
+    
+    @pytest.fixture
+    def analyzer(self, config):
+        """Create DummyAnalyzer instance"""
+        return DummyAnalyzer(client=None, config=config)
+    
+    def test_get_resource_tags(self, analyzer):
+        """Test AWS tag list conversion"""
+        tags = [{'Key': 'Name', 'Value': 'web'}, {'Key': 'Team', 'Value': 'ops'}]
+        assert analyzer.get_resource_tags(tags) == {'Name': 'web', 'Team': 'ops'}
+        assert analyzer.get_resource_tags([]) == {}
+        assert analyzer.get_resource_tags(None) == {}
+    
+    def test_filter_by_tags_without_exclusions(self, analyzer):
+        """Test resources are included when no exclude_tags are passed"""
+        assert analyzer.filter_by_tags({'tags': {'Environment': 'production'}}) is True
+        assert analyzer.filter_by_tags({}) is True
+    
+    def test_filter_by_tags_explicit_exclusions(self, analyzer):
+        """Test explicit exclude_tags override the configured ones"""
+        resource = {'tags': {'Environment': 'production', 'Team': 'data'}}
+        assert analyzer.filter_by_tags(resource, {'Team': 'data'}) is False
+        assert analyzer.filter_by_tags(resource, {'Team': 'web'}) is True
+        assert analyzer.filter_by_tags(resource, {}) is True
+        assert analyzer.filter_by_tags(resource, analyzer.config['exclude_tags']) is False
+    
+    def test_filter_by_tags_list_values(self, config):
+        """Test a list of exclude_tags values excludes each value and skips unhashable ones"""
+        config['exclude_tags'] = {'Environment': ['prod', 'staging'], 'Owner': [['nested']]}
+        analyzer = DummyAnalyzer(client=None, config=config)
+        exclude_tags = config['exclude_tags']
+        
+        assert analyzer.filter_by_tags({'tags': {'Environment': 'staging'}}, exclude_tags) is False
+        assert analyzer.filter_by_tags({'tags': {'Environment': 'dev'}}, exclude_tags) is True
+    
+    def test_add_finding_accumulates_savings(self, analyzer):
+        """Test findings and savings are accumulated"""
+        analyzer.add_finding({'id': 'a', 'monthly_cost': 10.0})
+        analyzer.add_finding({'id': 'b', 'monthly_cost': 2.5})
+        
+        results = analyzer.get_results()
+        
+        assert [r['id'] for r in results['resources']] == ['a', 'b']
+        assert results['total_savings'] == pytest.approx(12.5)
+    
+    def test_metric_averages_cached_only_when_complete(self, config, tmp_path):
+        """Test metrics from a failed get_metric_data batch are not cached"""
+        cloudwatch = MagicMock()
+        cloudwatch.meta.region_name = 'us-east-1'
+        cloudwatch.get_metric_data.side_effect = RuntimeError('Throttling')
+        analyzer = DummyAnalyzer(client=None, config=config, api_cache=APICache('123456789012', cache_dir=tmp_path))
+        analyzer.cloudwatch = cloudwatch
+        analyzer.max_workers = 2
+        
+        averages = analyzer._batch_get_metric_set('AWS/EC2', ['CPUUtilization'], 'InstanceId', ['i-1'], 3600, 7)
+        
+        assert averages == {'CPUUtilization': {}}
+        assert list(tmp_path.iterdir()) == []
+        
+        # Once the call succeeds, the averages are cached for the rerun
+        cloudwatch.get_metric_data.side_effect = None
+        cloudwatch.get_metric_data.return_value = {
+            'MetricDataResults': [{'Id': 'm0_0', 'Values': [1.0, 3.0]}]
+        }
+        for _ in range(2):
+            averages = analyzer._batch_get_metric_set('AWS/EC2', ['CPUUtilization'], 'InstanceId', ['i-1'], 3600, 7)
+            assert averages == {'CPUUtilization': {'i-1': 2.0}}
+        assert cloudwatch.get_metric_data.call_count == 2
+    
+    @pytest.fixture
+    def cloudwatch(self):
+        """Stub CloudWatch client"""
+        cloudwatch = MagicMock()
+        cloudwatch.meta.region_name = 'us-east-1'
+        return cloudwatch
+    
+    @pytest.fixture
+    def metrics_analyzer(self, analyzer, cloudwatch):
+        """DummyAnalyzer set up for metric batching"""
+        analyzer.cloudwatch = cloudwatch
+        analyzer.max_workers = 1
+        return analyzer
+    
+    def test_metric_query_ids_encode_metric_and_resource(self, metrics_analyzer, cloudwatch):
+        """Test m<metric>_<index> query IDs are built and mapped back to resources"""
+        cloudwatch.get_metric_data.return_value = {
+            'MetricDataResults': [
+                {'Id': 'm0_0', 'Values': [2.0, 4.0]},
+                {'Id': 'm0_1', 'Values': []},
+                {'Id': 'm1_1', 'Values': [5.0]}
+            ]
+        }
+        
+        averages = metrics_analyzer._batch_get_metric_set(
+            'AWS/RDS', ['CPUUtilization', 'DatabaseConnections'], 'DBInstanceIdentifier', ['db-a', 'db-b'], 3600, 7
+        )
+        
+        queries = cloudwatch.get_metric_data.call_args.kwargs['MetricDataQueries']
+        assert [
+            (query['Id'], query['MetricStat']['Metric']['MetricName'],
+             query['MetricStat']['Metric']['Dimensions'][0]['Value'])
+            for query in queries
+        ] == [
+            ('m0_0', 'CPUUtilization', 'db-a'),
+            ('m0_1', 'CPUUtilization', 'db-b'),
+            ('m1_0', 'DatabaseConnections', 'db-a'),
+            ('m1_1', 'DatabaseConnections', 'db-b')
+        ]
+        assert averages == {
+            'CPUUtilization': {'db-a': 3.0},
+            'DatabaseConnections': {'db-b': 5.0}
+        }
+    
+    def test_metric_values_accumulate_across_pages(self, metrics_analyzer, cloudwatch):
+        """Test datapoints from NextToken pages are averaged together"""
+        cloudwatch.get_metric_data.side_effect = [
+            {'MetricDataResults': [{'Id': 'm0_0', 'Values': [1.0]}], 'NextToken': 'page-2'},
+            {'MetricDataResults': [{'Id': 'm0_0', 'Values': [2.0, 6.0]}]}
+        ]
+        
+        averages = metrics_analyzer._batch_get_metrics('AWS/EC2', 'CPUUtilization', 'InstanceId', ['i-1'], 3600, 7)
+        
+        assert averages == {'i-1': 3.0}
+        assert cloudwatch.get_metric_data.call_args_list[1].kwargs['NextToken'] == 'page-2'
+    
+    def test_metric_batches_split_by_query_limit(self, metrics_analyzer, cloudwatch):
+        """Test two metrics per resource put 250 resources in each call"""
+        cloudwatch.get_metric_data.return_value = {'MetricDataResults': []}
+        resource_ids = [f'db-{i}' for i in range(300)]
+        
+        metrics_analyzer._batch_get_metric_set(
+            'AWS/RDS', ['CPUUtilization', 'DatabaseConnections'], 'DBInstanceIdentifier', resource_ids, 3600, 7
+        )
+        
+        assert [
+            len(call.kwargs['MetricDataQueries']) for call in cloudwatch.get_metric_data.call_args_list
+        ] == [500, 100]
+    
+    def test_failed_metric_batch_leaves_other_batches(self, metrics_analyzer, cloudwatch):
+        """Test a failing batch only drops the metrics of its own resources"""
+        def get_metric_data(MetricDataQueries, **kwargs):
+            if MetricDataQueries[0]['MetricStat']['Metric']['Dimensions'][0]['Value'] == 'i-0':
+                raise RuntimeError('Throttling')
+            return {'MetricDataResults': [{'Id': query['Id'], 'Values': [1.0]} for query in MetricDataQueries]}
+        cloudwatch.get_metric_data.side_effect = get_metric_data
+        resource_ids = [f'i-{i}' for i in range(600)]
+        
+        averages = metrics_analyzer._batch_get_metrics('AWS/EC2', 'CPUUtilization', 'InstanceId', resource_ids, 3600, 7)
+        
+        assert sorted(averages) == sorted(resource_ids[500:])
+    
+    def test_id_filters_chunk_candidates(self, config):
+        """Test tag index candidates are split into filters of at most max_values IDs"""
+        tag_lookup = MagicMock()
+        tag_lookup.get_resource_ids.return_value = {f'vol-{i:03d}' for i in range(250)}
+        analyzer = DummyAnalyzer(client=None, config=config, tag_lookup=tag_lookup)
+        
+        filters = analyzer.get_id_filters('ec2:volume', 'volume-id')
+        assert [len(id_filters[0]['Values']) for id_filters in filters] == [200, 50]
+        assert filters[0][0]['Name'] == 'volume-id'
+        
+        filters = analyzer.get_id_filters('rds:db', 'db-instance-id', max_values=100)
+        assert [len(id_filters[0]['Values']) for id_filters in filters] == [100, 100, 50]
+    
+    def test_id_filters_without_tag_index(self, analyzer):
+        """Test a single unfiltered describe call is made without a tag index"""
+        assert analyzer.get_id_filters('ec2:volume', 'volume-id') == [[]]
+    
+    def test_no_tag_index_candidates_skips_describe(self, config):
+        """Test no describe call is made when the tag index matched nothing"""
+        client = MagicMock()
+        tag_lookup = MagicMock()
+        tag_lookup.get_resource_ids.return_value = set()
+        analyzer = EBSAnalyzer(client, config, tag_lookup)
+        
+        assert list(analyzer._get_all_volumes()) == []
+        client.get_paginator.return_value.paginate.assert_not_called()
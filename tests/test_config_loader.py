@@ -0,0 +1,80 @@
+"""
+Test Config Loader
+"""
+
+import os
+import pytest
+from utils.config_loader import ConfigLoader, _parse_yaml
+
+
+class TestConfigLoader:
+    """Test cases for ConfigLoader"""
+    
+    def test_parsed_yaml_is_cached_as_json(self, tmp_path):
+        """Test that a parsed config is saved next to the YAML and reused"""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text("ec2:\n  cpu_threshold: 5.0\n")
+        
+        config = ConfigLoader(config_path).load()
+        
+        cache_path = tmp_path / 'config.yaml.json'
+        assert config == {'ec2': {'cpu_threshold': 5.0}}
+        assert cache_path.exists()
+        
+        # A fresh cached copy is used instead of the YAML by a new process
+        cache_path.write_text('{"ec2": {"cpu_threshold": 10.0}}')
+        _parse_yaml.cache_clear()
+        assert ConfigLoader(config_path).load() == {'ec2': {'cpu_threshold': 10.0}}
+    
+    def test_cached_copy_is_private(self, tmp_path):
+        """Test that the JSON copy is readable by the owner only"""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text("notifications:\n  slack:\n    webhook_url: https://hooks.example/secret\n")
+        
+        ConfigLoader(config_path).load()
+        
+        assert (tmp_path / 'config.yaml.json').stat().st_mode & 0o777 == 0o600
+        assert [path.name for path in tmp_path.iterdir() if path.suffix == '.tmp'] == []
+    
+    def test_modified_yaml_invalidates_cache(self, tmp_path):
+        """Test that the YAML is parsed again once it is newer than the cache"""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text("ec2:\n  cpu_threshold: 5.0\n")
+        ConfigLoader(config_path).load()
+        
+        config_path.write_text("ec2:\n  cpu_threshold: 7.5\n")
+        cache_mtime = (tmp_path / 'config.yaml.json').stat().st_mtime
+        os.utime(config_path, (cache_mtime + 1, cache_mtime + 1))
+        
+        assert ConfigLoader(config_path).load() == {'ec2': {'cpu_threshold': 7.5}}
+    
+    def test_loaded_config_can_be_modified(self, tmp_path):
+        """Test that changes to a loaded config do not leak into later loads"""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text("aws:\n  regions: [us-east-1]\n")
+        
+        config = ConfigLoader(config_path).load()
+        config['aws']['regions'] = ['eu-west-1']
+        
+        assert ConfigLoader(config_path).load() == {'aws': {'regions': ['us-east-1']}}
+    
+    def test_validate_config_checks_value_ranges(self, tmp_path):
+        """Test that out-of-range thresholds fail validation"""
+        loader = ConfigLoader(tmp_path / 'missing.yaml')
+        loader.config = loader._get_default_config()
+        assert loader.validate_config()
+        
+        loader.config['ec2']['cpu_threshold'] = 150
+        assert not loader.validate_config()
+    
+    def test_pricing_is_shared_and_read_only(self, tmp_path):
+        """Test that pricing is parsed once and returned as a read-only mapping"""
+        pricing_path = tmp_path / 'pricing.yaml'
+        pricing_path.write_text("regions:\n  default:\n    ebs:\n      gp3: 0.08\n")
+        
+        pricing = ConfigLoader().load_pricing(pricing_path)
+        
+        assert ConfigLoader().load_pricing(pricing_path) is pricing
+        assert pricing['regions']['default']['ebs']['gp3'] == 0.08
+        with pytest.raises(TypeError):
+            pricing['regions']['default']['ebs']['gp3'] = 0.1
@@ -83,6 +83,19 @@ class TestCostCalculator:
         expected = 0.05 * 50  # price per GB * size
         assert cost == pytest.approx(expected, rel=0.01)
     
+    def test_calculate_ec2_cost_bulk(self, calculator):
+        """Test bulk EC2 cost calculation matches per-instance costs"""
+        instance_types = ['t2.micro', 't3.small', 't2.micro', 't3.small', 'm5.large']
+        regions = ['us-east-1', 'us-east-1', 'eu-west-1', 'eu-west-1', 'us-east-1']
+        
+        costs = calculator.calculate_ec2_cost_bulk(instance_types, regions)
+        
+        expected = [
+            calculator.calculate_ec2_cost(instance_type, region)
+            for instance_type, region in zip(instance_types, regions)
+        ]
+        assert costs.tolist() == pytest.approx(expected)
+    
     def test_calculate_total_savings(self, calculator):
         """Test total savings calculation"""
         resources = [
@@ -0,0 +1,88 @@
+"""
+Test EC2 Analyzer
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from analyzers.ec2_analyzer import EC2Analyzer
+from utils.cost_calculator import CostCalculator
+
+
+class TestEC2Analyzer:
+    """Test cases for EC2Analyzer"""
+    
+    @pytest.fixture
+    def config(self):
+        """Sample configuration for testing"""
+        return {
+            'pricing': {'pricing_file': 'config/pricing.yaml'},
+            'ec2': {'cpu_threshold': 5.0, 'minimum_uptime_hours': 24, 'max_workers': 1}
+        }
+    
+    @pytest.fixture
+    def cloudwatch(self):
+        """CloudWatch client reporting 1% CPU for every queried instance"""
+        client = MagicMock()
+        client.get_metric_data.side_effect = lambda MetricDataQueries, **kwargs: {
+            'MetricDataResults': [{'Id': query['Id'], 'Values': [1.0]} for query in MetricDataQueries]
+        }
+        return client
+    
+    @staticmethod
+    def ec2_client(instances):
+        """EC2 client whose describe_instances paginator returns the given instances"""
+        client = MagicMock()
+        client.meta.region_name = 'us-east-1'
+        client.get_paginator.return_value.paginate.return_value = [
+            {'Reservations': [{'Instances': instances}]}
+        ]
+        return client
+    
+    @staticmethod
+    def instance(instance_id, instance_type, uptime):
+        """Running instance launched the given timedelta ago"""
+        return {
+            'InstanceId': instance_id,
+            'InstanceType': instance_type,
+            'LaunchTime': datetime.now(timezone.utc) - uptime,
+            'State': {'Name': 'running'}
+        }
+    
+    def test_idle_instances_priced_in_one_bulk_call(self, config, cloudwatch):
+        """Test idle instances are priced together and match single-instance costs"""
+        client = self.ec2_client([
+            self.instance('i-1', 't3.micro', timedelta(days=30)),
+            self.instance('i-2', 'm5.large', timedelta(days=30))
+        ])
+        analyzer = EC2Analyzer(client, cloudwatch, config)
+        
+        with patch.object(CostCalculator, 'calculate_ec2_cost_bulk', autospec=True,
+                          side_effect=CostCalculator.calculate_ec2_cost_bulk) as bulk:
+            results = analyzer.analyze()
+        
+        bulk.assert_called_once()
+        calculator = CostCalculator(config)
+        assert [(resource['instance_id'], resource['monthly_cost']) for resource in results['resources']] == [
+            ('i-1', calculator.calculate_ec2_cost('t3.micro', 'us-east-1')),
+            ('i-2', calculator.calculate_ec2_cost('m5.large', 'us-east-1'))
+        ]
+        assert all(type(resource['monthly_cost']) is float for resource in results['resources'])
+    
+    def test_recent_instances_skip_metrics(self, config, cloudwatch):
+        """Test instances below the minimum uptime are not queried for metrics"""
+        client = self.ec2_client([
+            self.instance('i-old', 't3.micro', timedelta(days=30)),
+            self.instance('i-new', 't3.micro', timedelta(hours=2))
+        ])
+        analyzer = EC2Analyzer(client, cloudwatch, config)
+        
+        results = analyzer.analyze()
+        
+        queried = [
+            query['MetricStat']['Metric']['Dimensions'][0]['Value']
+            for call in cloudwatch.get_metric_data.call_args_list
+            for query in call.kwargs['MetricDataQueries']
+        ]
+        assert queried == ['i-old']
+        assert [resource['instance_id'] for resource in results['resources']] == ['i-old']
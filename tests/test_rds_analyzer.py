@@ -0,0 +1,28 @@
+"""
+Test RDS Analyzer
+"""
+
+from unittest.mock import MagicMock
+from analyzers.rds_analyzer import RDSAnalyzer
+
+
+class TestRDSAnalyzer:
+    """Test cases for RDSAnalyzer"""
+    
+    def test_idle_mask_handles_missing_metrics(self):
+        """Test missing CPU never counts as idle, while missing connections do not rule it out"""
+        config = {
+            'pricing': {'pricing_file': 'config/pricing.yaml'},
+            'rds': {'cpu_threshold': 5.0, 'connections_threshold': 1}
+        }
+        analyzer = RDSAnalyzer(MagicMock(), MagicMock(), config)
+        instances = [
+            {'DBInstanceIdentifier': db_instance_id}
+            for db_instance_id in ('idle', 'busy-cpu', 'busy-connections', 'no-cpu', 'no-connections')
+        ]
+        cpu_averages = {'idle': 1.0, 'busy-cpu': 50.0, 'busy-connections': 1.0, 'no-connections': 1.0}
+        connection_averages = {'idle': 0.0, 'busy-cpu': 0.0, 'busy-connections': 10.0, 'no-cpu': 0.0}
+        
+        idle_mask = analyzer._idle_mask(instances, cpu_averages, connection_averages)
+        
+        assert idle_mask.tolist() == [True, False, False, False, True]
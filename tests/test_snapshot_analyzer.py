@@ -0,0 +1,45 @@
+"""
+Test Snapshot Analyzer
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from analyzers.snapshot_analyzer import SnapshotAnalyzer
+
+
+class TestSnapshotAnalyzer:
+    """Test cases for SnapshotAnalyzer"""
+    
+    def test_start_time_patterns_cover_days_up_to_cutoff(self):
+        """Test start-time wildcards cover every day up to and including the cutoff"""
+        cutoff = datetime(2024, 3, 2, 15, 30, tzinfo=timezone.utc)
+        
+        patterns = SnapshotAnalyzer._start_time_patterns(cutoff)
+        
+        assert patterns == [
+            '200*', '201*',
+            '2020-*', '2021-*', '2022-*', '2023-*',
+            '2024-01-*', '2024-02-*',
+            '2024-03-01*', '2024-03-02*'
+        ]
+    
+    def test_no_outdated_snapshots_skips_ami_lookup(self):
+        """Test that AMIs are not listed when no snapshot is past retention"""
+        client = MagicMock()
+        client.meta.region_name = 'us-east-1'
+        client.describe_snapshots.return_value = {
+            'Snapshots': [{
+                'SnapshotId': 'snap-new',
+                'StartTime': datetime.now(timezone.utc),
+                'VolumeSize': 10
+            }]
+        }
+        config = {
+            'pricing': {'pricing_file': 'config/pricing.yaml'},
+            'snapshots': {'retention_days': 90, 'exclude_ami_snapshots': True}
+        }
+        
+        results = SnapshotAnalyzer(client, config).analyze()
+        
+        assert results['resources'] == []
+        client.describe_images.assert_not_called()
@@ -0,0 +1,38 @@
+"""
+Test Tag Lookup
+"""
+
+from unittest.mock import MagicMock
+from utils.tag_lookup import TagLookup
+
+
+class TestTagLookup:
+    """Test cases for TagLookup"""
+    
+    def test_parse_arn_resource_forms(self):
+        """Test EC2 'type/id' and RDS 'type:id' ARNs are split into type and ID"""
+        assert TagLookup._parse_arn(
+            'arn:aws:ec2:us-east-1:123456789012:volume/vol-0abc'
+        ) == ('ec2:volume', 'vol-0abc')
+        assert TagLookup._parse_arn(
+            'arn:aws:ec2:us-east-1:123456789012:elastic-ip/eipalloc-0abc'
+        ) == ('ec2:elastic-ip', 'eipalloc-0abc')
+        assert TagLookup._parse_arn(
+            'arn:aws:rds:us-east-1:123456789012:db:orders-db'
+        ) == ('rds:db', 'orders-db')
+    
+    def test_resource_ids_grouped_by_type(self):
+        """Test tagged resources are fetched once and grouped by resource type"""
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = [{
+            'ResourceTagMappingList': [
+                {'ResourceARN': 'arn:aws:ec2:us-east-1:123456789012:volume/vol-1'},
+                {'ResourceARN': 'arn:aws:rds:us-east-1:123456789012:db:orders-db'}
+            ]
+        }]
+        tag_lookup = TagLookup(client, {'Environment': 'dev'})
+        
+        assert tag_lookup.get_resource_ids('ec2:volume') == {'vol-1'}
+        assert tag_lookup.get_resource_ids('rds:db') == {'orders-db'}
+        assert tag_lookup.get_resource_ids('ec2:instance') == set()
+        client.get_paginator.return_value.paginate.assert_called_once()